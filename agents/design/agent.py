@@ -1,3 +1,4 @@
+import asyncio
 import discord
 import json
 import logging
@@ -36,6 +37,8 @@ class DesignAgent(BaseAgent):
         self.state_store = self._load_state()
         self.boot_time = datetime.datetime.now(datetime.timezone.utc)
         self.mapping_file = os.path.join(os.getcwd(), "thread_notion_mapping.csv")
+        self._mapping_mtime = None
+        self._mapping_rows = {}
         
         # Initialize skills with dynamic import
         skills_init_path = os.path.join(agent_dir, 'skills', '__init__.py')
@@ -58,22 +61,22 @@ class DesignAgent(BaseAgent):
     
     def _load_state(self):
         path = self._state_path()
-        if not os.path.exists(path):
-            self.logger.info(f"State file does not exist yet: {path}")
-            return {}
         try:
             with open(path, "r") as f:
                 state = json.load(f)
                 self.logger.info(f"Loaded state from {path}: {len(state)} threads")
                 return state
+        except FileNotFoundError:
+            self.logger.info(f"State file does not exist yet: {path}")
+            return {}
         except Exception as e:
             self.logger.error(f"Failed to load state store from {path}: {e}")
             return {}
     
     def _save_state(self):
         path = self._state_path()
-        os.makedirs(os.path.dirname(path), exist_ok=True)
         try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
             with open(path, "w") as f:
                 json.dump(self.state_store, f, indent=2)
             self.logger.debug(f"State saved to {path}: {len(self.state_store)} threads")
@@ -100,28 +103,44 @@ class DesignAgent(BaseAgent):
     
     # ==================== CSV MAPPING ====================
     
-    def _get_notion_url_from_csv(self, thread_id: int) -> tuple[Optional[str], Optional[str]]:
-        """Read thread-Notion mapping from CSV file. Returns (notion_url, status)."""
+    def _load_mapping_rows(self) -> dict:
+        """
+        Returns {thread_id: (notion_url, status)} from the CSV mapping file.
+        The parsed rows are reused until the file's mtime changes.
+        """
         import csv
-        
-        if not os.path.exists(self.mapping_file):
+
+        try:
+            mtime = os.stat(self.mapping_file).st_mtime_ns
+        except FileNotFoundError:
             self.logger.warning(f"Mapping file not found: {self.mapping_file}")
-            return None, None
-        
+            self._mapping_mtime = None
+            self._mapping_rows = {}
+            return self._mapping_rows
+
+        if mtime == self._mapping_mtime:
+            return self._mapping_rows
+
+        rows = {}
         try:
             with open(self.mapping_file, 'r', encoding='utf-8') as f:
                 reader = csv.DictReader(f)
                 for row in reader:
-                    if row['thread_id'] == str(thread_id):
-                        notion_url = row.get('notion_url', '').strip()
-                        status = row.get('status', '').strip()
-                        if notion_url:
-                            return notion_url, status
-                        return None, status
+                    notion_url = (row.get('notion_url') or '').strip()
+                    status = (row.get('status') or '').strip()
+                    # First row for a thread wins, as in a top-down scan
+                    rows.setdefault(row['thread_id'], (notion_url or None, status))
         except Exception as e:
             self.logger.error(f"Error reading mapping file: {e}")
-        
-        return None, None
+            return {}
+
+        self._mapping_mtime = mtime
+        self._mapping_rows = rows
+        return rows
+
+    def _get_notion_url_from_csv(self, thread_id: int) -> tuple[Optional[str], Optional[str]]:
+        """Read thread-Notion mapping from CSV file. Returns (notion_url, status)."""
+        return self._load_mapping_rows().get(str(thread_id), (None, None))
     
     # ==================== HELPER METHODS ====================
     
@@ -205,6 +224,38 @@ class DesignAgent(BaseAgent):
             self.logger.warning(f"Failed to recover state: {e}")
         return "init"
     
+    async def _get_starter_message(self, channel, thread_id: int):
+        """Returns the thread's starter message, from the client cache when possible."""
+        starter = getattr(channel, "starter_message", None)
+        if starter is not None and starter.id == thread_id:
+            return starter
+        return await channel.fetch_message(thread_id)
+    
+    async def _find_existing_task(self, guild, thread_id: int) -> Optional[str]:
+        """Looks up the thread's task by its Discord Thread property, off the event loop."""
+        if not guild:
+            return None
+        return await asyncio.to_thread(
+            self.bot.notion.find_task_by_discord_thread,
+            self.notion_db_id,
+            guild.id,
+            thread_id
+        )
+    
+    async def _extract_starter_notion_url(self, context: SkillContext, channel, thread_id: int) -> Optional[str]:
+        """Returns the Notion link in the starter message (USING SKILL), or None."""
+        try:
+            return await self.skills_executor.execute(
+                "extract_notion_url",
+                context,
+                thread=channel,
+                thread_id=thread_id,
+                expected_database_id=self.notion_db_id
+            )
+        except Exception as e:
+            self.logger.error(f"Error extracting Notion URL via skill: {e}")
+            return None
+    
     async def _build_thread_context(self, channel: discord.Thread, thread_id: int, limit: int = 20):
         """
         Builds a compact context payload including conversation memory summaries.
@@ -221,7 +272,7 @@ class DesignAgent(BaseAgent):
 
         # Fetch starter message
         try:
-            starter = await channel.fetch_message(thread_id)
+            starter = await self._get_starter_message(channel, thread_id)
             starter_content = starter.content or ""
         except Exception as e:
             self.logger.warning(f"Failed to fetch starter message: {e}")
@@ -386,35 +437,23 @@ class DesignAgent(BaseAgent):
                 self._set_thread_state(thread_id, {"state": "ignored_existing"})
                 return
 
-            # FALLBACK: Notion API check (for new threads not in CSV yet)
-            if message.guild:
-                existing_url = self.bot.notion.find_task_by_discord_thread(
-                    self.notion_db_id,
-                    message.guild.id,
-                    thread_id
-                )
-                if existing_url:
-                    self.logger.info(f"Thread {thread_id} found via Notion API (Discord Thread property): {existing_url}")
-                    self._set_thread_state(thread_id, {"state": "approved", "notion_url": existing_url})
-                    return
-            
-            # FALLBACK: Look for Notion link in the starter message itself (USING SKILL)
+            # FALLBACK: Notion API check (for new threads not in CSV yet) and the
+            # Notion link in the starter message are independent; look them up
+            # together. The Notion API result still takes precedence.
             context = SkillContext(agent=self, message=message)
-            try:
-                notion_url_from_starter = await self.skills_executor.execute(
-                    "extract_notion_url",
-                    context,
-                    thread=message.channel,
-                    thread_id=thread_id,
-                    expected_database_id=self.notion_db_id
-                )
-                
-                if notion_url_from_starter:
-                    self.logger.info(f"Thread {thread_id} has Notion link in starter message: {notion_url_from_starter}")
-                    self._set_thread_state(thread_id, {"state": "approved", "notion_url": notion_url_from_starter})
-                    return
-            except Exception as e:
-                self.logger.error(f"Error extracting Notion URL via skill: {e}")
+            existing_url, notion_url_from_starter = await asyncio.gather(
+                self._find_existing_task(message.guild, thread_id),
+                self._extract_starter_notion_url(context, message.channel, thread_id)
+            )
+            if existing_url:
+                self.logger.info(f"Thread {thread_id} found via Notion API (Discord Thread property): {existing_url}")
+                self._set_thread_state(thread_id, {"state": "approved", "notion_url": existing_url})
+                return
+            
+            if notion_url_from_starter:
+                self.logger.info(f"Thread {thread_id} has Notion link in starter message: {notion_url_from_starter}")
+                self._set_thread_state(thread_id, {"state": "approved", "notion_url": notion_url_from_starter})
+                return
 
             # Ignore pre-existing threads on boot (except for exception threads)
             try:
@@ -550,7 +589,7 @@ class DesignAgent(BaseAgent):
         
         # Fetch starter message for full context
         try:
-            starter = await message.channel.fetch_message(thread_id)
+            starter = await self._get_starter_message(message.channel, thread_id)
             full_content = starter.content
         except:
             full_content = message.content
@@ -628,7 +667,7 @@ class DesignAgent(BaseAgent):
         """Handle validation after user edits."""
         # Fetch starter message and re-validate
         try:
-            starter = await message.channel.fetch_message(thread_id)
+            starter = await self._get_starter_message(message.channel, thread_id)
             user_prompt = f"STARTER MESSAGE CONTENT: {starter.content}"
             
             result_json = self.bot.llm.generate_completion(prompt_template, user_prompt, json_mode=True)
@@ -5,6 +5,7 @@ Manages persistent conversation memory by creating summaries every 20 messages.
 Each thread gets its own markdown file tracking agreements, deadlines, and key discussions.
 """
 
+import asyncio
 import json
 import logging
 import sys
@@ -13,6 +14,11 @@ import datetime
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
 from src.skills.base import BaseSkill, SkillContext
 
@@ -30,6 +36,17 @@ class ConversationMemorySkill(BaseSkill):
     
     SUMMARY_INTERVAL = 20  # Generate summary every N messages
     
+    # Memory file layout: header once, then "summary + separator" per append
+    HEADER_TEMPLATE = (
+        "# Thread Memory: {thread_title}\n"
+        "Thread ID: {thread_id}\n"
+        "Created: {created}\n"
+        "\n"
+        "---\n"
+        "\n"
+    )
+    SUMMARY_SEPARATOR = "\n\n---\n\n"
+    
     def __init__(self, llm_handler, memory_base_path: str = None):
         """
         Initialize the skill.
@@ -45,6 +62,10 @@ class ConversationMemorySkill(BaseSkill):
         self.llm = llm_handler
         self.memory_base_path = memory_base_path or os.path.join(os.getcwd(), "memory", "threads")
         
+        # Write-through cache of memory file contents, keyed by path and
+        # validated against the file's (mtime_ns, size) so outside edits win
+        self._content_cache: Dict[str, tuple] = {}
+        
         # Load prompt template
         self.prompt_template = self._load_prompt_template()
     
@@ -66,11 +87,6 @@ class ConversationMemorySkill(BaseSkill):
         """Get the memory file path for a specific thread."""
         return self._get_memory_dir(thread_id) / "conversation_memory.md"
     
-    def _ensure_memory_dir(self, thread_id: int) -> None:
-        """Ensure the memory directory exists for a thread."""
-        memory_dir = self._get_memory_dir(thread_id)
-        memory_dir.mkdir(parents=True, exist_ok=True)
-    
     async def should_create_summary(
         self,
         context: SkillContext,
@@ -138,8 +154,6 @@ class ConversationMemorySkill(BaseSkill):
             self.logger.debug("Summary threshold not reached, skipping")
             return None
         
-        # Ensure memory directory exists
-        self._ensure_memory_dir(thread_id)
         memory_file = self._get_memory_file_path(thread_id)
         
         # Calculate summary number and range
@@ -147,10 +161,6 @@ class ConversationMemorySkill(BaseSkill):
         start_msg = last_summary_count + 1
         end_msg = summary_number * self.SUMMARY_INTERVAL
         
-        # Initialize memory file if it doesn't exist
-        if not memory_file.exists():
-            await self._initialize_memory_file(memory_file, thread_id, thread_title)
-        
         # Format messages for LLM
         formatted_messages = self._format_messages_for_llm(messages)
         
@@ -166,8 +176,9 @@ class ConversationMemorySkill(BaseSkill):
             self.logger.error("Failed to generate summary")
             return None
         
-        # Append summary to memory file
-        await self._append_summary_to_file(memory_file, summary)
+        # Append summary to memory file (writes the header on first use)
+        header = self._build_header(thread_id, thread_title)
+        await self._append_summary_to_file(memory_file, summary, header)
         
         # Store metadata in context
         context.set("last_summary_created", {
@@ -184,24 +195,13 @@ class ConversationMemorySkill(BaseSkill):
         
         return str(memory_file)
     
-    async def _initialize_memory_file(
-        self,
-        file_path: Path,
-        thread_id: int,
-        thread_title: str
-    ) -> None:
-        """Initialize a new memory file with header."""
-        header = f"""# Thread Memory: {thread_title or 'Untitled Thread'}
-Thread ID: {thread_id}
-Created: {datetime.datetime.utcnow().isoformat()}
-
----
-
-"""
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(header)
-        
-        self.logger.info(f"Initialized memory file: {file_path}")
+    def _build_header(self, thread_id: int, thread_title: str) -> str:
+        """Build the header written at the top of a new memory file."""
+        return self.HEADER_TEMPLATE.format_map({
+            "thread_title": thread_title or "Untitled Thread",
+            "thread_id": thread_id,
+            "created": datetime.datetime.utcnow().isoformat(),
+        })
     
     def _format_messages_for_llm(self, messages: List[Dict[str, Any]]) -> str:
         """Format messages into a readable format for the LLM."""
@@ -255,8 +255,10 @@ Remember to:
 """
         
         try:
-            # Call LLM (not in JSON mode - we want markdown)
-            summary = self.llm.generate_completion(
+            # Call LLM (not in JSON mode - we want markdown); the completion
+            # blocks, so keep it off the event loop
+            summary = await asyncio.to_thread(
+                self.llm.generate_completion,
                 self.prompt_template,
                 user_prompt,
                 json_mode=False
@@ -268,14 +270,57 @@ Remember to:
             self.logger.error(f"LLM summary generation failed: {e}", exc_info=True)
             return None
     
-    async def _append_summary_to_file(self, file_path: Path, summary: str) -> None:
-        """Append a new summary to the memory file."""
-        with open(file_path, "a", encoding="utf-8") as f:
-            f.write(summary)
-            f.write("\n\n---\n\n")
+    async def _append_summary_to_file(self, file_path: Path, summary: str, header: str) -> None:
+        """
+        Append a new summary to the memory file, creating it if needed.
+        
+        The file is locked while writing and the header is only written when
+        the file is empty, so concurrent summaries for the same thread can
+        neither duplicate the header nor interleave their entries. The write
+        runs in a worker thread so waiting on the lock never blocks the loop.
+        """
+        is_new = await asyncio.to_thread(self._write_summary, file_path, summary, header)
         
+        if is_new:
+            self.logger.info(f"Initialized memory file: {file_path}")
         self.logger.debug(f"Appended summary to {file_path}")
     
+    def _write_summary(self, file_path: Path, summary: str, header: str) -> bool:
+        """Append one summary under an exclusive lock; returns True if the file was new."""
+        flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+        try:
+            fd = os.open(file_path, flags, 0o644)
+        except FileNotFoundError:
+            # First summary for this thread: create its directory and retry
+            Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(file_path, flags, 0o644)
+        key = str(file_path)
+        with os.fdopen(fd, "a", encoding="utf-8") as f:
+            if fcntl:
+                # Released when the file is closed
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            before = os.fstat(f.fileno())
+            is_new = before.st_size == 0
+            text = (header if is_new else "") + summary + self.SUMMARY_SEPARATOR
+            # Single write so the summary and its separator land together
+            f.write(text)
+            f.flush()
+            
+            # Extend the cached content only if it matched the file we appended to
+            cached = self._content_cache.get(key)
+            if is_new:
+                base = ""
+            elif cached and cached[0] == (before.st_mtime_ns, before.st_size):
+                base = cached[1]
+            else:
+                base = None
+            if base is None:
+                self._content_cache.pop(key, None)
+            else:
+                after = os.fstat(f.fileno())
+                self._content_cache[key] = ((after.st_mtime_ns, after.st_size), base + text)
+        return is_new
+    
     async def load_memory(self, thread_id: int) -> Optional[str]:
         """
         Load existing memory summary for a thread.
@@ -287,22 +332,34 @@ Remember to:
             Memory content as string, or None if no memory exists
         """
         memory_file = self._get_memory_file_path(thread_id)
-        
-        if not memory_file.exists():
-            self.logger.debug(f"No memory file found for thread {thread_id}")
-            return None
+        key = str(memory_file)
         
         try:
-            with open(memory_file, "r", encoding="utf-8") as f:
-                content = f.read()
+            stat = os.stat(memory_file)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            cached = self._content_cache.get(key)
+            if cached and cached[0] == signature:
+                content = cached[1]
+            else:
+                with open(memory_file, "r", encoding="utf-8") as f:
+                    content = f.read()
+                self._content_cache[key] = (signature, content)
             
             self.logger.info(f"Loaded memory for thread {thread_id} ({len(content)} chars)")
             return content
             
+        except FileNotFoundError:
+            self.logger.debug(f"No memory file found for thread {thread_id}")
+            return None
         except Exception as e:
             self.logger.error(f"Failed to load memory file: {e}")
             return None
     
+    def peek(self, thread_id: int) -> Optional[str]:
+        """Return the cached memory content for a thread without touching the disk."""
+        cached = self._content_cache.get(str(self._get_memory_file_path(thread_id)))
+        return cached[1] if cached else None
+    
     async def validate_input(self, context: SkillContext, **kwargs) -> bool:
         """Validate that required parameters are provided."""
         required = ["thread_id", "messages"]
@@ -14,6 +14,11 @@ import discord
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
 from src.skills.base import BaseSkill, SkillContext
 
+# Same URL shape the Notion link formatter (utilities/notion.py) recognizes;
+# kept local so the skill does not load that module under a second name.
+# test_extract_notion_url.py checks the two patterns stay identical.
+_NOTION_URL_RE = re.compile(r'(https?://(?:\S+\.)?notion\.(?:so|site)/[^\s]+)')
+
 
 class ExtractNotionURLSkill(BaseSkill):
     """
@@ -55,21 +60,20 @@ class ExtractNotionURLSkill(BaseSkill):
             Notion URL if found and valid, None otherwise
         """
         try:
-            # Fetch starter message
-            starter = await thread.fetch_message(thread_id)
+            # Starter message, from the client cache when possible
+            starter = getattr(thread, "starter_message", None)
+            if starter is None or starter.id != thread_id:
+                starter = await thread.fetch_message(thread_id)
             content = starter.content or ""
             
-            # Extract Notion URLs using regex
-            notion_urls = re.findall(
-                r'(https?://(?:\S+\.)?notion\.(?:so|site)/[^\s]+)',
-                content
-            )
+            # Only the first Notion URL is used, so stop at the first match
+            match = _NOTION_URL_RE.search(content)
             
-            if not notion_urls:
+            if not match:
                 self.logger.debug(f"No Notion URLs found in thread {thread_id}")
                 return None
             
-            first_url = notion_urls[0]
+            first_url = match.group(1)
             
             # Validate against expected database if provided
             if expected_database_id:
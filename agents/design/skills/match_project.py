@@ -8,11 +8,43 @@ import re
 import logging
 import sys
 import os
-from typing import List, Optional
+import functools
+from typing import List, Optional, Tuple
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
 from src.skills.base import BaseSkill, SkillContext
 
+# Everything except letters, digits, underscore and whitespace
+_CANON_RE = re.compile(r'[^\w\s]')
+
+# Same deletion for ASCII text as a str.translate table (no regex engine)
+_CANON_ASCII_TABLE = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128)) if _CANON_RE.match(c)
+))
+
+# Canonical forms that explicitly mean "no project"
+_NO_PROJECT = frozenset({"sinproyecto", "ninguno", "na", "none"})
+
+
+class ProjectIndex:
+    """
+    Reverse index from canonical project name to the Notion option.
+    Build it once per catalog; each match is then a single dict hit.
+    """
+    
+    __slots__ = ("_map",)
+    
+    def __init__(self, options: List[str]):
+        self._map = {MatchProjectSkill._canonical_project(opt): opt for opt in options}
+    
+    def lookup(self, canonical: str) -> Optional[str]:
+        """Returns the option for an already canonicalized name, or None."""
+        return self._map.get(canonical)
+    
+    def match(self, raw: str) -> Optional[str]:
+        """Returns the option whose canonical form equals raw's, or None."""
+        return self._map.get(MatchProjectSkill._canonical_project(raw))
+
 
 class MatchProjectSkill(BaseSkill):
     """
@@ -54,6 +86,7 @@ class MatchProjectSkill(BaseSkill):
         ]
     
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _canonical_project(value: str) -> str:
         """
         Normalize project name for fuzzy matching.
@@ -72,11 +105,24 @@ class MatchProjectSkill(BaseSkill):
             return ""
         
         # Remove special characters except letters/numbers
-        normalized = re.sub(r'[^\w\s]', '', value.lower())
+        lowered = value.lower()
+        if lowered.isascii():
+            normalized = lowered.translate(_CANON_ASCII_TABLE)
+        else:
+            normalized = _CANON_RE.sub('', lowered)
         # Remove all spaces
         normalized = normalized.replace(' ', '')
         return normalized
     
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _project_index(options: Tuple[str, ...]) -> ProjectIndex:
+        """
+        ProjectIndex for a set of options.
+        Cached, since the project catalog rarely changes between calls.
+        """
+        return ProjectIndex(options)
+    
     async def get_valid_options(self, database_id: str) -> List[str]:
         """
         Get valid project options from Notion via MCP.
@@ -132,15 +178,12 @@ class MatchProjectSkill(BaseSkill):
         candidate = self._canonical_project(project_raw)
         
         # Check for explicit "no project" indicators
-        if candidate in {"sinproyecto", "ninguno", "na", "none"}:
+        if candidate in _NO_PROJECT:
             self.logger.info(f"Project marked as N/A: {project_raw}")
             return None
         
-        # Build canonical mapping
-        by_canon = {self._canonical_project(opt): opt for opt in options}
-        
         # Try exact canonical match
-        matched = by_canon.get(candidate)
+        matched = self._project_index(tuple(options)).lookup(candidate)
         
         if matched:
             self.logger.info(f"Matched '{project_raw}' -> '{matched}'")
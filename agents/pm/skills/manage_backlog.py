@@ -6,11 +6,18 @@ Helps ensure the team always has work queued up but isn't overwhelmed.
 """
 
 import logging
+from functools import lru_cache
 from typing import Dict, Any, List
 from datetime import datetime, timedelta
 from src.skills.base import BaseSkill, SkillContext
 
 
+@lru_cache(maxsize=1024)
+def _parse_deadline(deadline: str) -> datetime:
+    """Parse a Notion deadline string; backlog tasks often share deadlines."""
+    return datetime.fromisoformat(deadline.replace("Z", "+00:00"))
+
+
 class ManageBacklogSkill(BaseSkill):
     """
     Skill to manage and prioritize the backlog.
@@ -169,7 +176,7 @@ class ManageBacklogSkill(BaseSkill):
         # Check deadline urgency
         if deadline:
             try:
-                deadline_date = datetime.fromisoformat(deadline.replace("Z", "+00:00"))
+                deadline_date = _parse_deadline(deadline)
                 days_until_deadline = (deadline_date - datetime.now(deadline_date.tzinfo)).days
                 
                 if days_until_deadline < 0:
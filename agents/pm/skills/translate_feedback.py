@@ -10,6 +10,13 @@ import json
 from typing import Dict, Any, Optional
 from src.skills.base import BaseSkill, SkillContext
 
+try:
+    import orjson
+except ImportError:  # Optional: faster decoding of LLM JSON replies
+    orjson = None
+
+_json_loads = orjson.loads if orjson else json.loads
+
 
 class TranslateFeedbackSkill(BaseSkill):
     """
@@ -124,7 +131,7 @@ class TranslateFeedbackSkill(BaseSkill):
                 user_prompt=prompt,
                 json_mode=True
             )
-            return json.loads(result)
+            return _json_loads(result)
         except Exception as e:
             self.logger.warning(f"Error checking clarity: {e}")
             # Default to assuming it's clear enough
@@ -205,7 +212,7 @@ class TranslateFeedbackSkill(BaseSkill):
                 user_prompt=prompt,
                 json_mode=True
             )
-            return json.loads(result)
+            return _json_loads(result)
         except Exception as e:
             self.logger.error(f"Error translating feedback: {e}")
             # Fallback to basic translation
@@ -11,4 +11,5 @@ if [[ ! -x "$PYTHON" ]]; then
   "$VENV/bin/pip" install -r "$ROOT/requirements.txt"
 fi
 
-"$PYTHON" -m unittest discover -s "$ROOT/tests"
+# pytest picks these up from tests/conftest.py; unittest needs them here
+PYTHONPATH="$ROOT/src:$ROOT${PYTHONPATH:+:$PYTHONPATH}" "$PYTHON" -m unittest discover -s "$ROOT/tests"
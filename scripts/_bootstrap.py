@@ -0,0 +1,16 @@
+"""
+Puts src/ and the project root at the front of sys.path for the scripts in
+this folder. Import it before any project import:
+
+    import _bootstrap  # noqa: F401
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC = os.path.join(ROOT, "src")
+
+for path in (ROOT, SRC):
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -2,10 +2,9 @@ import os
 import sys
 import argparse
 
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-from dotenv import load_dotenv
-from services.notion import NotionHandler
+import _bootstrap  # noqa: F401
+import env_once
+from services.notion import get_notion
 
 
 def build_thread_url(guild_id: int, thread_id: int) -> str:
@@ -13,7 +12,7 @@ def build_thread_url(guild_id: int, thread_id: int) -> str:
 
 
 def main():
-    load_dotenv()
+    env_once.ensure()
 
     parser = argparse.ArgumentParser(
         description="Link a Discord thread ID to a Notion task by writing the thread URL into the database."
@@ -26,13 +25,14 @@ def main():
     args = parser.parse_args()
 
     db_id = args.db_id or os.getenv("NOTION_DB_ID") or "9b1d386dbae1401b8a58af5a792e8f1f"
-    guild_id = args.guild_id or os.getenv("DISCORD_GUILD_ID")
+    # DISCORD_GUILD_ID=0 (a common placeholder) counts as unset
+    guild_id = args.guild_id or int(os.getenv("DISCORD_GUILD_ID") or 0)
 
     if not guild_id:
         print("Missing guild ID. Provide --guild-id or set DISCORD_GUILD_ID.")
         sys.exit(1)
 
-    notion = NotionHandler()
+    notion = get_notion()
     if not notion.is_enabled():
         print("Notion client not configured. Set NOTION_TOKEN.")
         sys.exit(1)
@@ -42,7 +42,7 @@ def main():
         print("Could not parse page ID from Notion URL.")
         sys.exit(1)
 
-    thread_url = build_thread_url(int(guild_id), args.thread_id)
+    thread_url = build_thread_url(guild_id, args.thread_id)
     ok = notion.update_task_with_thread_link(
         database_id=db_id,
         page_id=page_id,
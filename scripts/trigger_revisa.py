@@ -2,21 +2,11 @@ import sys
 import os
 import asyncio
 import discord
-from dotenv import load_dotenv
 
-# Ensure we are in the project root for path resolution
-sys.path.append(os.path.abspath("src"))
-sys.path.append(os.getcwd())
+import _bootstrap  # noqa: F401
+import env_once
 
-try:
-    from services.notion import NotionHandler
-    from services.llm import LLMHandler
-    from agents.design.agent import DesignAgent
-except ImportError as e:
-    print(f"Import Error: {e}")
-    sys.exit(1)
-
-load_dotenv()
+env_once.ensure()
 TOKEN = os.getenv("DISCORD_TOKEN")
 TARGET_ID = 1470846699198222489
 
@@ -25,14 +15,17 @@ class OneOffBot(discord.Client):
         intents = discord.Intents.default()
         intents.message_content = True
         super().__init__(intents=intents)
-        self.notion = NotionHandler()
+        # Service imports are deferred until the bot is actually started
+        from services.notion import get_notion
+        from services.llm import LLMHandler
+        self.notion = get_notion()
         self.llm = LLMHandler()
 
     async def on_ready(self):
         print(f"Logged in as {self.user} for Manual Trigger")
         try:
             print(f"Fetching target {TARGET_ID}...")
-            channel = await self.fetch_channel(TARGET_ID)
+            channel = self.get_channel(TARGET_ID) or await self.fetch_channel(TARGET_ID)
             
             if not isinstance(channel, discord.Thread):
                 print(f"Target is not a Thread, it is {type(channel)}.")
@@ -42,10 +35,11 @@ class OneOffBot(discord.Client):
             print(f"Found Thread: {channel.name} ({channel.id})")
             
             print("Fetching starter message...")
-            message = await channel.fetch_message(TARGET_ID)
+            message = channel.starter_message or await channel.fetch_message(TARGET_ID)
             print(f"Message content preview: {message.content[:100]}...")
 
             print("Initializing DesignAgent...")
+            from agents.design.agent import DesignAgent
             agent_dir = os.path.abspath("agents/design")
             agent = DesignAgent(self, "design", agent_dir)
             
@@ -65,5 +59,9 @@ if __name__ == "__main__":
     if not TOKEN:
         print("Error: DISCORD_TOKEN not found.")
     else:
-        bot = OneOffBot()
+        try:
+            bot = OneOffBot()
+        except ImportError as e:
+            print(f"Import Error: {e}")
+            sys.exit(1)
         bot.run(TOKEN)
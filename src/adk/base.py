@@ -79,11 +79,11 @@ class BaseAgent(commands.Cog):
 
     async def preload_memory(self, user_id, topic="default"):
         path = self.get_memory_path(user_id, topic)
-        if not os.path.exists(path):
+        try:
+            async with aiofiles.open(path, mode='r') as f:
+                content = await f.read()
+        except FileNotFoundError:
             return ""
-        
-        async with aiofiles.open(path, mode='r') as f:
-            content = await f.read()
         self.logger.info(f"Memory read: {path}")
         return content
 
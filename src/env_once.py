@@ -0,0 +1,12 @@
+import functools
+
+from dotenv import load_dotenv
+
+
+@functools.cache
+def ensure() -> bool:
+    """
+    Loads .env into the environment the first time it is called; later calls
+    from other entry points or imported modules are free.
+    """
+    return load_dotenv()
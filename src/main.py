@@ -3,7 +3,6 @@ import sys
 import discord
 import asyncio
 from discord.ext import commands
-from dotenv import load_dotenv
 
 # Add src directory to path to allow imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -12,17 +11,21 @@ from services.notion import NotionHandler
 from services.llm import LLMHandler
 from services.mcp import NotionMCPClient
 from keep_alive import keep_alive
+import env_once
 from adk import AgentManager
-from utilities.notion import process_notion_links
+from utilities.notion import process_notion_links, warm_webhook_cache
 
 # Load environment variables
-load_dotenv()
+env_once.ensure()
 DISCORD_TOKEN = os.getenv("DISCORD_TOKEN")
 
 # Initialize Services
-notion_service = NotionHandler()
+notion_service = NotionHandler(
+    thread_cache_path=os.path.join(os.getcwd(), "memory", "notion_cache.sqlite")
+)
 llm_service = LLMHandler()
-notion_mcp_client = NotionMCPClient()
+# Reuse the handler's pooled, orjson-decoding SDK client
+notion_mcp_client = NotionMCPClient(client=notion_service.client)
 
 class MyBot(commands.Bot):
     def __init__(self):
@@ -44,6 +47,10 @@ class MyBot(commands.Bot):
         
         print("ADK Framework Initialized.")
 
+    async def close(self):
+        await self.notion_mcp.aclose()
+        await super().close()
+
     async def on_message(self, message):
         # Prevent bot recursion
         if message.author.bot:
@@ -68,6 +75,9 @@ class MyBot(commands.Bot):
         print(f'Logged in as {self.user} (ID: {self.user.id})')
         print('------')
         
+        # Resolve Notion formatter webhooks in the background
+        self._webhook_warmup = asyncio.create_task(warm_webhook_cache(self.guilds))
+        
         # Sync Commands (Slash Commands from Agents)
         guild_id = os.getenv("DISCORD_GUILD_ID")
         try:
@@ -2,13 +2,26 @@ import os
 import openai
 from typing import Optional, Dict
 
+# One OpenAI client per API key, shared by every LLMHandler in the process
+# so the bot and one-off scripts reuse the same HTTP connection pool.
+_SHARED_CLIENTS: Dict[str, openai.Client] = {}
+
+
+def _get_shared_client(api_key: str) -> openai.Client:
+    client = _SHARED_CLIENTS.get(api_key)
+    if client is None:
+        client = openai.Client(api_key=api_key)
+        _SHARED_CLIENTS[api_key] = client
+    return client
+
+
 class LLMHandler:
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         self.client = None
         if self.api_key:
             openai.api_key = self.api_key
-            self.client = openai.Client(api_key=self.api_key)
+            self.client = _get_shared_client(self.api_key)
 
     def load_prompt(self, prompt_name: str) -> str:
         """
@@ -6,10 +6,16 @@ enabling intelligent, context-aware interactions with Notion databases.
 """
 
 import os
+import asyncio
 import logging
 from typing import Optional, List, Dict, Any
 from notion_client import Client
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON for raw API calls
+    orjson = None
+
 
 class NotionMCPClient:
     """
@@ -22,15 +28,20 @@ class NotionMCPClient:
     - Relationship mapping
     """
     
-    def __init__(self, token: Optional[str] = None):
+    def __init__(self, token: Optional[str] = None, client: Optional[Client] = None):
         """
         Initialize the Notion MCP client.
         
         Args:
             token: Notion integration token. If None, reads from NOTION_TOKEN env var.
+            client: Existing SDK client to reuse (e.g. NotionHandler.client), so both
+                share one connection pool. If None, a new client is built from the token.
         """
         self.token = token or os.getenv("NOTION_TOKEN")
-        self.client = Client(auth=self.token) if self.token else None
+        if client is None and self.token:
+            client = Client(auth=self.token)
+        self.client = client
+        self._async_http = None  # Lazily created by aquery_database, closed by aclose
         self.logger = logging.getLogger(__name__)
         self._schema_cache = {}  # Cache database schemas
         
@@ -123,6 +134,7 @@ class NotionMCPClient:
             schema = {
                 "database_id": database_id,
                 "title": db.get("title", [{}])[0].get("plain_text", ""),
+                "title_property": None,
                 "properties": {}
             }
             
@@ -133,8 +145,12 @@ class NotionMCPClient:
                     "id": prop_def.get("id")
                 }
                 
+                # Notion guarantees exactly one title property per database
+                if prop_type == "title":
+                    schema["title_property"] = prop_name
+                
                 # Extract options for select/multi-select
-                if prop_type == "select":
+                elif prop_type == "select":
                     options = prop_def.get("select", {}).get("options", [])
                     prop_schema["options"] = [opt.get("name") for opt in options]
                     
@@ -212,12 +228,12 @@ class NotionMCPClient:
         """Extract title from a Notion page object."""
         props = page.get("properties", {})
         
-        # Find the title property
-        for prop_name, prop_value in props.items():
-            if prop_value.get("type") == "title":
-                title_array = prop_value.get("title", [])
-                if title_array:
-                    return title_array[0].get("plain_text", "")
+        # Find the title property (stops at the first, and only, match)
+        title_prop = next((p for p in props.values() if p.get("type") == "title"), None)
+        if title_prop:
+            title_array = title_prop.get("title", [])
+            if title_array:
+                return title_array[0].get("plain_text", "")
         
         return "Untitled"
     
@@ -246,8 +262,9 @@ class NotionMCPClient:
             schema = await self.get_database_schema(database_id)
             # TODO: Add property validation logic here
             
-            # Create the page
-            response = self.client.pages.create(
+            # Create the page (blocking SDK call, kept off the event loop)
+            response = await asyncio.to_thread(
+                self.client.pages.create,
                 parent={"database_id": database_id},
                 properties=properties,
                 children=content_blocks or []
@@ -259,6 +276,35 @@ class NotionMCPClient:
             self.logger.error(f"Failed to create page: {e}")
             return None
     
+    async def create_pages(
+        self,
+        database_id: str,
+        pages: List[Dict[str, Any]],
+        max_concurrency: int = 3
+    ) -> List[Optional[str]]:
+        """
+        Create several pages in a Notion database concurrently.
+        
+        Args:
+            database_id: Parent database ID
+            pages: One dict per page with "properties" and optional "content_blocks"
+            max_concurrency: Max in-flight creates (Notion allows ~3 req/s on average)
+            
+        Returns:
+            URL of each created page (None on failure), in input order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def create(page: Dict[str, Any]) -> Optional[str]:
+            async with semaphore:
+                return await self.create_page(
+                    database_id,
+                    page["properties"],
+                    page.get("content_blocks")
+                )
+        
+        return list(await asyncio.gather(*(create(page) for page in pages)))
+    
     async def update_page(
         self,
         page_id: str,
@@ -288,6 +334,64 @@ class NotionMCPClient:
             self.logger.error(f"Failed to update page: {e}")
             return False
     
+    def _build_query_request(
+        self,
+        database_id: str,
+        filter_params: Optional[Dict[str, Any]],
+        sorts: Optional[List[Dict[str, str]]],
+        start_cursor: Optional[str],
+        page_size: int
+    ) -> tuple:
+        """Build the (url, headers, payload) for a database query."""
+        # Build query payload
+        payload = {"page_size": page_size}
+        
+        if filter_params:
+            payload["filter"] = filter_params
+        
+        if sorts:
+            payload["sorts"] = sorts
+        
+        if start_cursor:
+            payload["start_cursor"] = start_cursor
+        
+        # Direct POST to Notion API
+        url = f"https://api.notion.com/v1/databases/{database_id}/query"
+        headers = {
+            "Authorization": f"Bearer {self.token}",
+            "Notion-Version": "2022-06-28",
+            "Content-Type": "application/json"
+        }
+        return url, headers, payload
+    
+    @staticmethod
+    def _encode_body(payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Returns the httpx request keyword for a JSON payload."""
+        if orjson:
+            return {"content": orjson.dumps(payload)}
+        return {"json": payload}
+    
+    @staticmethod
+    def _decode_response(response) -> Dict[str, Any]:
+        """Raises on HTTP errors, otherwise returns the decoded JSON body."""
+        response.raise_for_status()
+        if orjson:
+            return orjson.loads(response.content)
+        return response.json()
+    
+    def _get_async_http(self):
+        """Returns this client's pooled AsyncClient, creating it on first use."""
+        if self._async_http is None or self._async_http.is_closed:
+            import httpx
+            self._async_http = httpx.AsyncClient()
+        return self._async_http
+    
+    async def aclose(self) -> None:
+        """Closes the pooled AsyncClient used by aquery_database."""
+        if self._async_http is not None:
+            await self._async_http.aclose()
+            self._async_http = None
+    
     def query_database(
         self,
         database_id: str,
@@ -316,30 +420,53 @@ class NotionMCPClient:
         try:
             import httpx
             
-            # Build query payload
-            payload = {"page_size": page_size}
-            
-            if filter_params:
-                payload["filter"] = filter_params
+            url, headers, payload = self._build_query_request(
+                database_id, filter_params, sorts, start_cursor, page_size
+            )
             
-            if sorts:
-                payload["sorts"] = sorts
+            with httpx.Client() as http_client:
+                response = http_client.post(url, headers=headers, **self._encode_body(payload))
+                return self._decode_response(response)
             
-            if start_cursor:
-                payload["start_cursor"] = start_cursor
+        except Exception as e:
+            self.logger.error(f"Failed to query database: {e}", exc_info=True)
+            return {"results": []}
+    
+    async def aquery_database(
+        self,
+        database_id: str,
+        filter_params: Optional[Dict[str, Any]] = None,
+        sorts: Optional[List[Dict[str, str]]] = None,
+        start_cursor: Optional[str] = None,
+        page_size: int = 100
+    ) -> Dict[str, Any]:
+        """
+        Async variant of query_database; independent queries can be
+        awaited together with asyncio.gather.
+        
+        Args:
+            database_id: Database ID to query
+            filter_params: Notion filter object
+            sorts: List of sort objects
+            start_cursor: Pagination cursor
+            page_size: Number of results per page
             
-            # Direct POST to Notion API
-            url = f"https://api.notion.com/v1/databases/{database_id}/query"
-            headers = {
-                "Authorization": f"Bearer {self.token}",
-                "Notion-Version": "2022-06-28",
-                "Content-Type": "application/json"
-            }
+        Returns:
+            Query response with results
+        """
+        if not self.is_enabled():
+            self.logger.error("MCP client not enabled")
+            return {"results": []}
+        
+        try:
+            url, headers, payload = self._build_query_request(
+                database_id, filter_params, sorts, start_cursor, page_size
+            )
             
-            with httpx.Client() as http_client:
-                response = http_client.post(url, json=payload, headers=headers)
-                response.raise_for_status()
-                return response.json()
+            response = await self._get_async_http().post(
+                url, headers=headers, **self._encode_body(payload)
+            )
+            return self._decode_response(response)
             
         except Exception as e:
             self.logger.error(f"Failed to query database: {e}", exc_info=True)
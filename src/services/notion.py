@@ -1,22 +1,163 @@
+import atexit
 import os
+import functools
+import importlib.util
+import logging
+import re
+import httpx
 from notion_client import Client
 from typing import List, Dict, Optional
 
+from .notion_cache import ThreadLinkCache
+
+try:
+    import orjson
+except ImportError:  # Optional: faster decoding of Notion responses
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 lets the sequential lookups in find_task_by_discord_thread share a
+# single multiplexed connection. It needs the optional `h2` package.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Keep idle connections open long enough to survive the gaps between
+# Discord events, so most calls skip the TLS handshake.
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=10, keepalive_expiry=300)
+
+# One SDK client per token, shared by every NotionHandler in the process.
+_SHARED_CLIENTS: Dict[str, Client] = {}
+
+# 32 hex chars or hyphenated UUID
+_PAGE_ID_RE = re.compile(r'([a-f0-9]{32}|[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12})')
+
+# Pulls (guild_id, thread_id) out of a Discord thread link
+_THREAD_URL_RE = re.compile(r"discord\.com/channels/(\d+)/(\d+)")
+
+# Icon payloads by type. Emoji icons are a character, not a URL.
+_ICON_GETTERS = {
+    "emoji": lambda icon: icon.get("emoji"),
+    "external": lambda icon: icon.get("external", {}).get("url"),
+    "file": lambda icon: icon.get("file", {}).get("url"),
+}
+
+
+def _extract_title(props: Dict) -> str:
+    """Returns the plain text of the page's title property, or "Untitled"."""
+    # Heuristic to find the title property (usually type "title")
+    title_prop = next((p for p in props.values() if p.get("type") == "title"), None)
+    if title_prop:
+        title_parts = title_prop.get("title", [])
+        if title_parts:
+            return "".join([t.get("plain_text", "") for t in title_parts])
+    return "Untitled"
+
+
+def _extract_icon(icon: Optional[Dict]) -> Optional[str]:
+    if not icon:
+        return None
+    getter = _ICON_GETTERS.get(icon.get("type"))
+    return getter(icon) if getter else None
+
+
+# Notion caps each rich_text segment at 2000 chars (1900 leaves a safety
+# margin) and a single request at 100 children.
+_BLOCK_CHARS = 1900
+_MAX_CHILDREN = 100
+_MAX_CONTENT_CHARS = _BLOCK_CHARS * _MAX_CHILDREN
+
+# Notion accepts at most 100 conditions in one compound filter
+_MAX_FILTER_CLAUSES = 100
+
+
+def _chunk_blocks(content: str, chunk: int = _BLOCK_CHARS):
+    """
+    Yields paragraph blocks holding consecutive slices of content, at most
+    _MAX_CHILDREN of them.
+    """
+    for start in range(0, min(len(content), chunk * _MAX_CHILDREN), chunk):
+        yield {
+            "object": "block",
+            "type": "paragraph",
+            "paragraph": {
+                "rich_text": [
+                    {
+                        "type": "text",
+                        "text": {
+                            "content": content[start:start + chunk]
+                        }
+                    }
+                ]
+            }
+        }
+
+
+@functools.lru_cache(maxsize=4096)
+def _thread_urls(guild_id: int, thread_id: int) -> tuple:
+    """Returns (exact thread URL, search query) for a Discord thread."""
+    base = f"discord.com/channels/{guild_id}/{thread_id}"
+    return f"https://{base}/{thread_id}", base
+
+
+def _thread_property_value(prop: Optional[Dict]) -> Optional[str]:
+    """Returns the text of a url or rich_text page property holding a thread link."""
+    if not prop:
+        return None
+    if prop.get("type") == "rich_text":
+        return "".join(t.get("plain_text", "") for t in prop.get("rich_text") or [])
+    return prop.get("url")
+
+
+def _build_http_client() -> httpx.Client:
+    return httpx.Client(http2=_HTTP2_AVAILABLE, limits=_HTTP_LIMITS)
+
+
+class _OrjsonClient(Client):
+    """SDK client that decodes successful responses with orjson."""
+
+    def _parse_response(self, response: httpx.Response):
+        # Errors keep the SDK's own handling (status checks, APIResponseError)
+        if not response.is_success:
+            return super()._parse_response(response)
+        return orjson.loads(response.content)
+
+
+def _get_shared_client(token: str) -> Client:
+    client = _SHARED_CLIENTS.get(token)
+    if client is None:
+        http_client = _build_http_client()
+        # Close pooled keep-alive sockets cleanly when the process exits
+        atexit.register(http_client.close)
+        client_cls = _OrjsonClient if orjson else Client
+        client = client_cls(auth=token, client=http_client)
+        _SHARED_CLIENTS[token] = client
+    return client
+
+
 class NotionHandler:
-    def __init__(self, token: Optional[str] = None):
+    def __init__(self, token: Optional[str] = None, thread_cache_path: Optional[str] = None):
         self.token = token or os.getenv("NOTION_TOKEN")
         self.client = None
         self._cache = {} # Simple in-memory cache: {query: (timestamp, results)}
         self._cache_ttl = 60 # Seconds
+        self._page_prop_ttl = 3600 # Seconds; values we wrote ourselves rarely change
+        self._schema_ttl = 3600 # Seconds; a database's title property is practically fixed
+        # Thread links created or verified by this process:
+        # {(database_id, property_name, guild_id, thread_id): (verified_at, page_url)}
+        self._thread_index = {}
+        # Optional on-disk copy of found thread links, shared across restarts
+        self._thread_cache = ThreadLinkCache(thread_cache_path) if thread_cache_path else None
         if self.token:
-            self.client = Client(auth=self.token)
+            self.client = _get_shared_client(self.token)
 
     def is_enabled(self) -> bool:
         return self.client is not None
 
-    def search_pages(self, query: str, limit: int = 5) -> List[Dict]:
+    def search_pages(self, query: str, limit: int = 5, database_id: Optional[str] = None) -> List[Dict]:
         """
         Searches for pages in Notion matching the query.
+        With a database_id, only that database is queried, filtering on its
+        title property server-side instead of searching the whole workspace.
         Returns a list of dicts with 'id', 'title', 'url', 'icon'.
         """
         if not self.is_enabled():
@@ -25,56 +166,43 @@ class NotionHandler:
         # Check Cache
         import time
         now = time.time()
-        if query in self._cache:
-            timestamp, cached_results = self._cache[query]
+        cache_key = f"search:{database_id}:{query}" if database_id else query
+        if cache_key in self._cache:
+            timestamp, cached_results = self._cache[cache_key]
             if now - timestamp < self._cache_ttl:
                 return cached_results
 
         try:
-            response = self.client.search(
-                query=query,
-                filter={"value": "page", "property": "object"},
-                page_size=limit
-            )
+            if database_id:
+                title_property = self.get_title_property(database_id) or "Name"
+                response = self.client.databases.query(
+                    database_id=database_id,
+                    filter={"property": title_property, "title": {"contains": query}},
+                    page_size=limit
+                )
+            else:
+                response = self.client.search(
+                    query=query,
+                    filter={"value": "page", "property": "object"},
+                    page_size=limit
+                )
             
-            results = []
-            for page in response.get("results", []):
-                title = "Untitled"
-                # Extract title safely
-                props = page.get("properties", {})
-                
-                # Heuristic to find the title property (usually type "title")
-                for _, prop_val in props.items():
-                    if prop_val.get("type") == "title":
-                        title_parts = prop_val.get("title", [])
-                        if title_parts:
-                            title = "".join([t.get("plain_text", "") for t in title_parts])
-                        break
-                
-                # Icon
-                icon = page.get("icon", {})
-                icon_url = None
-                if icon:
-                    if icon.get("type") == "emoji":
-                        icon_url = icon.get("emoji") # Not a URL, but a char
-                    elif icon.get("type") == "external":
-                        icon_url = icon.get("external", {}).get("url")
-                    elif icon.get("type") == "file":
-                        icon_url = icon.get("file", {}).get("url")
-
-                results.append({
+            results = [
+                {
                     "id": page.get("id"),
-                    "title": title,
+                    "title": _extract_title(page.get("properties", {})),
                     "url": page.get("url"),
-                    "icon": icon_url
-                })
+                    "icon": _extract_icon(page.get("icon"))
+                }
+                for page in response.get("results", [])
+            ]
             
             # Update Cache
-            self._cache[query] = (now, results)
+            self._cache[cache_key] = (now, results)
             return results
 
         except Exception as e:
-            print(f"Error searching Notion: {e}")
+            logger.exception("Error searching Notion: %s", e)
             return []
 
     def _get_database_properties(self, database_id: str) -> Dict:
@@ -95,48 +223,55 @@ class NotionHandler:
             self._cache[cache_key] = (now, props)
             return props
         except Exception as e:
-            print(f"Error retrieving Notion database properties: {e}")
+            logger.exception("Error retrieving Notion database properties: %s", e)
             return {}
 
-    def get_multi_select_options(self, database_id: str, property_name: str) -> List[str]:
+    def get_title_property(self, database_id: str) -> Optional[str]:
         """
-        Returns the option names for a multi_select property in a Notion database.
+        Returns the name of the database's title property (e.g. "Name").
+        Cached much longer than the rest of the schema.
         """
+        if not self.is_enabled():
+            return None
+
+        import time
+        cache_key = f"title_prop:{database_id}"
+        now = time.time()
+        cached = self._cache.get(cache_key)
+        if cached and now - cached[0] < self._schema_ttl:
+            return cached[1]
+
+        props = self._get_database_properties(database_id)
+        title_property = next(
+            (name for name, info in props.items() if info.get("type") == "title"), None
+        )
+        if title_property:
+            self._cache[cache_key] = (now, title_property)
+        return title_property
+
+    def _get_property_options(self, database_id: str, property_name: str, property_type: str) -> List[str]:
         if not self.is_enabled():
             return []
 
         props = self._get_database_properties(database_id)
         prop_info = props.get(property_name) or {}
-        if prop_info.get("type") != "multi_select":
+        if prop_info.get("type") != property_type:
             return []
 
-        options = (prop_info.get("multi_select") or {}).get("options", []) or []
-        names = []
-        for opt in options:
-            name = opt.get("name")
-            if name:
-                names.append(name)
-        return names
+        options = (prop_info.get(property_type) or {}).get("options", []) or []
+        return [name for name in (opt.get("name") for opt in options) if name]
+
+    def get_multi_select_options(self, database_id: str, property_name: str) -> List[str]:
+        """
+        Returns the option names for a multi_select property in a Notion database.
+        """
+        return self._get_property_options(database_id, property_name, "multi_select")
     
     def get_select_options(self, database_id: str, property_name: str) -> List[str]:
         """
         Returns the option names for a select property in a Notion database.
         """
-        if not self.is_enabled():
-            return []
-
-        props = self._get_database_properties(database_id)
-        prop_info = props.get(property_name) or {}
-        if prop_info.get("type") != "select":
-            return []
-
-        options = (prop_info.get("select") or {}).get("options", []) or []
-        names = []
-        for opt in options:
-            name = opt.get("name")
-            if name:
-                names.append(name)
-        return names
+        return self._get_property_options(database_id, property_name, "select")
 
     def ensure_database_property(self, database_id: str, property_name: str, property_type: str = "url") -> bool:
         if not self.is_enabled():
@@ -155,9 +290,13 @@ class NotionHandler:
             self._cache.pop(f"db_props:{database_id}", None)
             return True
         except Exception as e:
-            print(f"Error updating Notion database with property '{property_name}': {e}")
+            logger.exception("Error updating Notion database with property '%s': %s", property_name, e)
             return False
 
+    @staticmethod
+    def _page_prop_key(page_id: str, property_name: str) -> str:
+        return f"page_prop:{page_id.replace('-', '')}:{property_name}"
+
     def set_page_property(self, page_id: str, property_name: str, property_type: str, value: str) -> bool:
         if not self.is_enabled():
             return False
@@ -171,9 +310,11 @@ class NotionHandler:
                 return False
 
             self.client.pages.update(page_id=page_id, properties=properties)
+            import time
+            self._cache[self._page_prop_key(page_id, property_name)] = (time.time(), value)
             return True
         except Exception as e:
-            print(f"Error updating Notion page property '{property_name}': {e}")
+            logger.exception("Error updating Notion page property '%s': %s", property_name, e)
             return False
 
     def update_task_with_thread_link(
@@ -189,6 +330,12 @@ class NotionHandler:
         if not thread_url:
             return False
 
+        # Skip the PATCH if we already wrote this exact value
+        import time
+        cached = self._cache.get(self._page_prop_key(page_id, property_name))
+        if cached and cached[1] == thread_url and time.time() - cached[0] < self._page_prop_ttl:
+            return True
+
         props = self._get_database_properties(database_id)
         prop_info = props.get(property_name)
 
@@ -200,7 +347,7 @@ class NotionHandler:
             prop_type = prop_info.get("type")
 
         if prop_type not in {"url", "rich_text"}:
-            print(f"Unsupported property type for '{property_name}': {prop_type}")
+            logger.warning("Unsupported property type for '%s': %s", property_name, prop_type)
             return False
 
         return self.set_page_property(page_id, property_name, prop_type, thread_url)
@@ -224,10 +371,26 @@ class NotionHandler:
             return None
 
         import time
-        exact_thread_url = f"https://discord.com/channels/{guild_id}/{thread_id}/{thread_id}"
-        search_query = f"discord.com/channels/{guild_id}/{thread_id}"
-        cache_key = f"thread:{database_id}:{exact_thread_url}"
+        guild_id, thread_id = int(guild_id), int(thread_id)
+        exact_thread_url, search_query = _thread_urls(guild_id, thread_id)
         now = time.time()
+
+        # A remembered link is trusted briefly; after that it is re-checked,
+        # since the page may have been archived or re-linked in Notion
+        link_key = (database_id, property_name, guild_id, thread_id)
+        indexed = self._thread_index.get(link_key)
+        if indexed and now - indexed[0] < self._cache_ttl:
+            return indexed[1]
+        known_url = indexed[1] if indexed else None
+        if not known_url and self._thread_cache:
+            known_url = self._thread_cache.get(*link_key)
+        if known_url:
+            if self._thread_link_is_current(known_url, property_name, exact_thread_url):
+                self._thread_index[link_key] = (now, known_url)
+                return known_url
+            self._forget_thread_link(link_key)
+
+        cache_key = f"thread:{database_id}:{property_name}:{require_property}:{exact_thread_url}"
         if cache_key in self._cache:
             timestamp, cached_results = self._cache[cache_key]
             if now - timestamp < self._cache_ttl:
@@ -255,6 +418,7 @@ class NotionHandler:
                     if results:
                         notion_url = results[0].get("url")
                         self._cache[cache_key] = (now, notion_url)
+                        self._store_thread_link(link_key, notion_url)
                         return notion_url
             elif require_property:
                 self._cache[cache_key] = (now, None)
@@ -277,26 +441,140 @@ class NotionHandler:
                     notion_url = page.get("url")
                     break
 
+            # Found by text search, not through the property: cache briefly only
             self._cache[cache_key] = (now, notion_url)
             return notion_url
         except Exception as e:
-            print(f"Error searching Notion for thread URL: {e}")
+            logger.exception("Error searching Notion for thread URL: %s", e)
             return None
 
+    def find_tasks_by_discord_threads(
+        self,
+        database_id: str,
+        guild_id: int,
+        thread_ids: List[int],
+        property_name: str = "Discord Thread"
+    ) -> Dict[int, Optional[str]]:
+        """
+        Batch form of find_task_by_discord_thread (property lookup only).
+        Threads not recently verified are resolved with one OR-filtered query
+        per 100 threads instead of one query each; the query also re-checks
+        remembered links, which are dropped if it no longer returns them.
+        Returns {thread_id: page URL or None} for every requested thread.
+        """
+        found: Dict[int, Optional[str]] = {int(thread_id): None for thread_id in thread_ids}
+        if not self.is_enabled() or not guild_id or not found:
+            return found
+
+        import time
+        guild_id = int(guild_id)
+        now = time.time()
+        pending = []
+        for thread_id in found:
+            indexed = self._thread_index.get((database_id, property_name, guild_id, thread_id))
+            if indexed and now - indexed[0] < self._cache_ttl:
+                found[thread_id] = indexed[1]
+            else:
+                pending.append(thread_id)
+        if not pending:
+            return found
+
+        prop_type = (self._get_database_properties(database_id).get(property_name) or {}).get("type")
+        if prop_type not in {"url", "rich_text"}:
+            return found
+
+        try:
+            for start in range(0, len(pending), _MAX_FILTER_CLAUSES):
+                batch = pending[start:start + _MAX_FILTER_CLAUSES]
+                query = {
+                    "database_id": database_id,
+                    "filter": {"or": [
+                        {"property": property_name, prop_type: {"equals": _thread_urls(guild_id, thread_id)[0]}}
+                        for thread_id in batch
+                    ]},
+                    "page_size": 100,
+                }
+                while True:
+                    response = self.client.databases.query(**query)
+                    for page in response.get("results", []):
+                        value = _thread_property_value(page.get("properties", {}).get(property_name))
+                        match = _THREAD_URL_RE.search(value or "")
+                        thread_id = int(match.group(2)) if match else None
+                        if thread_id in found and not found[thread_id]:
+                            found[thread_id] = page.get("url")
+                            self._store_thread_link(
+                                (database_id, property_name, guild_id, thread_id), found[thread_id]
+                            )
+                    if not response.get("has_more"):
+                        break
+                    query["start_cursor"] = response.get("next_cursor")
+        except Exception as e:
+            logger.exception("Error searching Notion for thread URLs: %s", e)
+            return found
+
+        for thread_id in pending:
+            if not found[thread_id]:
+                self._forget_thread_link((database_id, property_name, guild_id, thread_id))
+        return found
+
+    def _thread_link_is_current(self, page_url: str, property_name: str, thread_url: str) -> bool:
+        """True if the page still exists, is not archived and its property still holds thread_url."""
+        page_id = self.extract_page_id(page_url)
+        if not page_id:
+            return False
+        try:
+            page = self.client.pages.retrieve(page_id=page_id)
+        except Exception as e:
+            logger.warning("Could not verify thread link %s: %s", page_url, e)
+            return False
+        if page.get("archived") or page.get("in_trash"):
+            return False
+        return _thread_property_value(page.get("properties", {}).get(property_name)) == thread_url
+
+    def _store_thread_link(self, link_key: tuple, page_url: Optional[str]) -> None:
+        """Remembers a link found through the thread property; link_key is
+        (database_id, property_name, guild_id, thread_id)."""
+        if not page_url:
+            return
+        import time
+        self._thread_index[link_key] = (time.time(), page_url)
+        if self._thread_cache:
+            try:
+                self._thread_cache.set(*link_key, page_url)
+            except Exception as e:
+                logger.warning("Could not persist thread link for %s: %s", link_key[-1], e)
+
+    def _forget_thread_link(self, link_key: tuple) -> None:
+        self._thread_index.pop(link_key, None)
+        if self._thread_cache:
+            try:
+                self._thread_cache.discard(*link_key)
+            except Exception as e:
+                logger.warning("Could not drop thread link for %s: %s", link_key[-1], e)
+
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def extract_page_id(url: str) -> Optional[str]:
         """
         Extracts the UUID from a Notion URL.
         Format usually: https://notion.so/Page-Title-<UUID>?...
         """
-        import re
-        # Match 32 hex chars or hyphenated UUID
-        match = re.search(r'([a-f0-9]{32}|[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12})', url)
+        match = _PAGE_ID_RE.search(url)
         if match:
             # Return without hyphens for consistency
             return match.group(1).replace("-", "")
         return None
 
+    @staticmethod
+    def extract_page_ids(urls: List[str]) -> List[Optional[str]]:
+        """
+        Batch form of extract_page_id: one page ID (or None) per URL, in order.
+        """
+        return [
+            match.group(1).replace("-", "") if match else None
+            for match in map(_PAGE_ID_RE.search, urls)
+        ]
+
     def get_page_info(self, page_id: str) -> Optional[Dict]:
         """
         Fetches a page by ID to get its title and URL.
@@ -304,39 +582,27 @@ class NotionHandler:
         if not self.is_enabled():
             return None
 
+        import time
+        cache_key = f"page:{page_id}"
+        now = time.time()
+        if cache_key in self._cache:
+            timestamp, cached_results = self._cache[cache_key]
+            if now - timestamp < self._cache_ttl:
+                return cached_results
+
         try:
             page = self.client.pages.retrieve(page_id=page_id)
-            
-            # Extract title
-            title = "Untitled"
-            props = page.get("properties", {})
-            for _, prop_val in props.items():
-                if prop_val.get("type") == "title":
-                    title_parts = prop_val.get("title", [])
-                    if title_parts:
-                        title = "".join([t.get("plain_text", "") for t in title_parts])
-                    break
-            
-            # Extract Icon
-            icon = page.get("icon", {})
-            icon_url = None
-            if icon:
-                if icon.get("type") == "emoji":
-                    icon_url = icon.get("emoji")
-                elif icon.get("type") == "external":
-                    icon_url = icon.get("external", {}).get("url")
-                elif icon.get("type") == "file":
-                    icon_url = icon.get("file", {}).get("url")
-
-            return {
+
+            info = {
                 "id": page.get("id"),
-                "title": title,
+                "title": _extract_title(page.get("properties", {})),
                 "url": page.get("url"),
-                "icon": icon_url
+                "icon": _extract_icon(page.get("icon"))
             }
+            self._cache[cache_key] = (now, info)
+            return info
         except Exception as e:
-            import sys
-            sys.stderr.write(f"Error fetching page {page_id}: {e}\n")
+            logger.exception("Error fetching page %s: %s", page_id, e)
             return None
 
     def create_task(
@@ -353,7 +619,7 @@ class NotionHandler:
         Creates a new task in the specified Notion database.
         Returns the URL of the created page or None.
         Matches schema:
-        - Name (title)
+        - Name (title; the database's actual title property is used if it differs)
         - Proyecto (multi_select)
         - Fecha de entrega (date)
         """
@@ -361,8 +627,9 @@ class NotionHandler:
             return None
 
         try:
+            title_property = self.get_title_property(database_id) or "Name"
             properties = {
-                "Name": {
+                title_property: {
                     "title": [
                         {
                             "text": {
@@ -391,39 +658,40 @@ class NotionHandler:
                     }
                 }
 
+            thread_linked = False
             if thread_url:
                 if self.ensure_database_property(database_id, thread_property_name, "url"):
                     properties[thread_property_name] = {
                         "url": thread_url
                     }
+                    thread_linked = True
 
             children = []
             if content:
-                # Add content as children blocks (Paragraph)
-                children.append({
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": [
-                            {
-                                "type": "text",
-                                "text": {
-                                    "content": content[:1900] # Truncate to avoid Notion limit (using 1900 for safety margin)
-                                }
-                            }
-                        ]
-                    }
-                })
+                # Add content as children blocks (Paragraph), all sent in the same request
+                if len(content) > _MAX_CONTENT_CHARS:
+                    logger.warning(
+                        "Task content is %d chars; only the first %d fit in one request",
+                        len(content), _MAX_CONTENT_CHARS
+                    )
+                children = list(_chunk_blocks(content))
             
             new_page = self.client.pages.create(
                 parent={"database_id": database_id},
                 properties=properties,
                 children=children
             )
-            return new_page.get("url")
+            page_url = new_page.get("url")
+            if thread_linked and page_url:
+                match = _THREAD_URL_RE.search(thread_url)
+                if match:
+                    guild_id, thread_id = int(match.group(1)), int(match.group(2))
+                    self._store_thread_link(
+                        (database_id, thread_property_name, guild_id, thread_id), page_url
+                    )
+            return page_url
         except Exception as e:
-            import sys
-            sys.stderr.write(f"Error creating task in Notion: {e}\n")
+            logger.exception("Error creating task in Notion: %s", e)
             return None
 
     def delete_page(self, page_id: str) -> bool:
@@ -436,8 +704,32 @@ class NotionHandler:
 
         try:
             self.client.pages.update(page_id=page_id, archived=True)
+            page_key = page_id.replace("-", "")
+            self._cache.pop(f"page:{page_id}", None)
+            self._cache.pop(f"page:{page_key}", None)
+            prop_prefix = f"page_prop:{page_key}:"
+            for key in [k for k in self._cache if k.startswith(prop_prefix)]:
+                del self._cache[key]
+            self._thread_index = {
+                key: entry for key, entry in self._thread_index.items() if page_key not in entry[1]
+            }
+            if self._thread_cache:
+                self._thread_cache.discard_page(page_key)
             return True
         except Exception as e:
-            import sys
-            sys.stderr.write(f"Error deleting page {page_id}: {e}\n")
+            logger.exception("Error deleting page %s: %s", page_id, e)
             return False
+
+
+def get_notion(token: Optional[str] = None) -> NotionHandler:
+    """
+    Returns the process-wide NotionHandler for a token (NOTION_TOKEN by default),
+    so scripts making several calls share one handler, its caches and its pooled connection.
+    """
+    # Resolve the default first so get_notion() and get_notion(<same token>) agree
+    return _notion_for_token(token or os.getenv("NOTION_TOKEN"))
+
+
+@functools.lru_cache(maxsize=None)
+def _notion_for_token(token: Optional[str]) -> NotionHandler:
+    return NotionHandler(token)
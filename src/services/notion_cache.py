@@ -0,0 +1,79 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS thread_links (
+    database_id TEXT NOT NULL,
+    property_name TEXT NOT NULL,
+    guild_id INTEGER NOT NULL,
+    thread_id INTEGER NOT NULL,
+    url TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (database_id, property_name, guild_id, thread_id)
+)
+"""
+
+
+class ThreadLinkCache:
+    """
+    Persistent map of Discord threads to the Notion task linked to them.
+    Survives restarts, so repeat lookups for a thread skip the Notion query.
+    Only found links are stored; a thread without a task is always re-checked.
+    Entries may be stale (the page archived or re-linked since), so callers
+    verify a hit against Notion before trusting it.
+    """
+
+    def __init__(self, path: str, ttl: float = 86400):
+        self.path = path
+        self.ttl = ttl
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Autocommit; the handler may be called from worker threads
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            # WAL lets the bot and one-off scripts read while another writes
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            # Links stored before property_name was part of the key
+            self._conn.execute("DROP TABLE IF EXISTS thread_map")
+            self._conn.execute(_SCHEMA)
+
+    def get(self, database_id: str, property_name: str, guild_id: int, thread_id: int) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, fetched_at FROM thread_links WHERE database_id = ?"
+                " AND property_name = ? AND guild_id = ? AND thread_id = ?",
+                (database_id, property_name, int(guild_id), int(thread_id))
+            ).fetchone()
+        if row and time.time() - row[1] < self.ttl:
+            return row[0]
+        return None
+
+    def set(self, database_id: str, property_name: str, guild_id: int, thread_id: int, url: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO thread_links VALUES (?, ?, ?, ?, ?, ?)",
+                (database_id, property_name, int(guild_id), int(thread_id), url, time.time())
+            )
+
+    def discard(self, database_id: str, property_name: str, guild_id: int, thread_id: int) -> None:
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM thread_links WHERE database_id = ?"
+                " AND property_name = ? AND guild_id = ? AND thread_id = ?",
+                (database_id, property_name, int(guild_id), int(thread_id))
+            )
+
+    def discard_page(self, page_key: str) -> None:
+        """Drops every thread linked to a page (page_key: page ID without hyphens)."""
+        with self._lock:
+            self._conn.execute("DELETE FROM thread_links WHERE instr(url, ?) > 0", (page_key,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
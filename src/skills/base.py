@@ -5,13 +5,27 @@ Skills are modular, reusable components that perform specific tasks.
 They can be used by agents to handle complex operations in a structured way.
 """
 
+import inspect
 import logging
+import sys
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable, Tuple
 from dataclasses import dataclass, field
 
 
-@dataclass
+_LOGGER_CACHE: Dict[str, logging.Logger] = {}
+
+
+def _get_skill_logger(name: str) -> logging.Logger:
+    """Return the "skill.<name>" logger, resolving it through logging only once."""
+    logger = _LOGGER_CACHE.get(name)
+    if logger is None:
+        logger = logging.getLogger(f"skill.{name}")
+        _LOGGER_CACHE[name] = logger
+    return logger
+
+
+@dataclass(slots=True)
 class SkillContext:
     """
     Shared context that can be passed between skills.
@@ -49,6 +63,8 @@ class BaseSkill(ABC):
     4. Be stateless (use context for state)
     """
     
+    __slots__ = ("name", "description", "logger")
+    
     def __init__(self, name: str, description: str = ""):
         """
         Initialize the skill.
@@ -57,9 +73,9 @@ class BaseSkill(ABC):
             name: Unique name for this skill
             description: Human-readable description of what the skill does
         """
-        self.name = name
+        self.name = sys.intern(name)
         self.description = description
-        self.logger = logging.getLogger(f"skill.{name}")
+        self.logger = _get_skill_logger(name)
     
     @abstractmethod
     async def execute(self, context: SkillContext, **kwargs) -> Any:
@@ -75,11 +91,13 @@ class BaseSkill(ABC):
         """
         pass
     
-    async def validate_input(self, context: SkillContext, **kwargs) -> bool:
+    def validate_input(self, context: SkillContext, **kwargs) -> bool:
         """
         Validate inputs before execution.
         
-        Override this method to add custom validation logic.
+        Override this method to add custom validation logic. Overrides may
+        be either regular or async methods; the executor awaits only the
+        async ones.
         
         Args:
             context: Skill context
@@ -107,9 +125,14 @@ class SkillRegistry:
     - Dependency resolution
     """
     
+    __slots__ = ("_skills", "_dispatch", "logger")
+    
     def __init__(self):
         """Initialize the skill registry."""
         self._skills: Dict[str, BaseSkill] = {}
+        # Bound (validate_input, validate_is_async, execute) per skill,
+        # resolved once at registration
+        self._dispatch: Dict[str, Tuple[Callable, bool, Callable]] = {}
         self.logger = logging.getLogger("skill.registry")
     
     def register(self, skill: BaseSkill) -> None:
@@ -122,11 +145,16 @@ class SkillRegistry:
         Raises:
             ValueError: If a skill with the same name already exists
         """
-        if skill.name in self._skills:
-            raise ValueError(f"Skill '{skill.name}' is already registered")
+        name = sys.intern(skill.name)
+        if self._skills.setdefault(name, skill) is not skill:
+            raise ValueError(f"Skill '{name}' is already registered")
         
-        self._skills[skill.name] = skill
-        self.logger.info(f"Registered skill: {skill.name}")
+        self._dispatch[name] = (
+            skill.validate_input,
+            inspect.iscoroutinefunction(skill.validate_input),
+            skill.execute,
+        )
+        self.logger.info(f"Registered skill: {name}")
     
     def get(self, name: str) -> Optional[BaseSkill]:
         """
@@ -138,7 +166,20 @@ class SkillRegistry:
         Returns:
             Skill instance or None if not found
         """
-        return self._skills.get(name)
+        # Names are interned at registration, so hits compare by identity
+        return self._skills.get(sys.intern(name))
+    
+    def get_dispatch(self, name: str) -> Optional[Tuple[Callable, bool, Callable]]:
+        """
+        Get a skill's pre-bound entry points by name.
+        
+        Args:
+            name: Name of the skill
+            
+        Returns:
+            (validate_input, validate_is_async, execute) or None if not found
+        """
+        return self._dispatch.get(name)
     
     def get_all(self) -> List[BaseSkill]:
         """
@@ -170,6 +211,7 @@ class SkillRegistry:
         """
         if name in self._skills:
             del self._skills[name]
+            del self._dispatch[name]
             self.logger.info(f"Unregistered skill: {name}")
             return True
         return False
@@ -177,6 +219,7 @@ class SkillRegistry:
     def clear(self) -> None:
         """Clear all registered skills."""
         self._skills.clear()
+        self._dispatch.clear()
         self.logger.info("Cleared all skills from registry")
 
 
@@ -216,19 +259,21 @@ class SkillExecutor:
             ValueError: If skill not found
             Exception: If skill execution fails
         """
-        skill = self.registry.get(skill_name)
-        if not skill:
+        dispatch = self.registry.get_dispatch(skill_name)
+        if not dispatch:
             raise ValueError(f"Skill '{skill_name}' not found in registry")
+        validate, validate_is_async, run = dispatch
         
         self.logger.debug(f"Executing skill: {skill_name}")
         
         try:
             # Validate input
-            if not await skill.validate_input(context, **kwargs):
+            valid = await validate(context, **kwargs) if validate_is_async else validate(context, **kwargs)
+            if not valid:
                 raise ValueError(f"Input validation failed for skill '{skill_name}'")
             
             # Execute
-            result = await skill.execute(context, **kwargs)
+            result = await run(context, **kwargs)
             
             self.logger.debug(f"Skill '{skill_name}' completed successfully")
             return result
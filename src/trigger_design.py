@@ -2,23 +2,10 @@ import sys
 import os
 import asyncio
 import discord
-from dotenv import load_dotenv
 
-# Ensure we are in the project root for path resolution
-# But we will run this from root via python3 src/trigger_design.py
-# Add src to path
-sys.path.append(os.path.abspath("src"))
-sys.path.append(os.getcwd())
+import env_once
 
-try:
-    from services.notion import NotionHandler
-    from services.llm import LLMHandler
-    from agents.design.agent import DesignAgent
-except ImportError as e:
-    print(f"Import Error: {e}")
-    sys.exit(1)
-
-load_dotenv()
+env_once.ensure()
 TOKEN = os.getenv("DISCORD_TOKEN")
 # The ID provided by user
 TARGET_ID = 1468642052827779317
@@ -28,8 +15,11 @@ class OneOffBot(discord.Client):
         intents = discord.Intents.default()
         intents.message_content = True
         super().__init__(intents=intents)
+        # Service imports are deferred until the bot is actually started
+        from services.notion import get_notion
+        from services.llm import LLMHandler
         # Mimic the structure expected by DesignAgent
-        self.notion = NotionHandler()
+        self.notion = get_notion()
         self.llm = LLMHandler()
 
     async def on_ready(self):
@@ -37,7 +27,7 @@ class OneOffBot(discord.Client):
         try:
             # Fetch the thread (Forum Post)
             print(f"Fetching target {TARGET_ID}...")
-            channel = await self.fetch_channel(TARGET_ID)
+            channel = self.get_channel(TARGET_ID) or await self.fetch_channel(TARGET_ID)
             
             if not isinstance(channel, discord.Thread):
                 print(f"Target is not a Thread, it is {type(channel)}. Trying to fetch as message if possible context allows...")
@@ -47,11 +37,12 @@ class OneOffBot(discord.Client):
             
             # The starter message usually has the same ID as the thread in Forum channels
             print("Fetching starter message...")
-            message = await channel.fetch_message(TARGET_ID)
+            message = getattr(channel, "starter_message", None) or await channel.fetch_message(TARGET_ID)
             print(f"Message content: {message.content[:50]}...")
 
             # Initialize Agent
             print("Initializing DesignAgent...")
+            from agents.design.agent import DesignAgent
             agent_dir = os.path.abspath("agents/design")
             if not os.path.exists(agent_dir):
                 print(f"Error: Agent dir {agent_dir} does not exist")
@@ -74,8 +65,18 @@ class OneOffBot(discord.Client):
         await self.close()
 
 if __name__ == "__main__":
+    # Run as python3 src/trigger_design.py: src/ is already on the path,
+    # the project root (for agents/) is added once, ahead of site-packages
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if root not in sys.path:
+        sys.path.insert(0, root)
+
     if not TOKEN:
         print("Error: DISCORD_TOKEN not found.")
     else:
-        bot = OneOffBot()
+        try:
+            bot = OneOffBot()
+        except ImportError as e:
+            print(f"Import Error: {e}")
+            sys.exit(1)
         bot.run(TOKEN)
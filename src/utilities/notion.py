@@ -1,88 +1,193 @@
 import re
-import sys
+import asyncio
+import logging
 import discord
+from typing import Optional
 
-async def process_notion_links(message: discord.Message, notion_service):
+logger = logging.getLogger(__name__)
+
+_NOTION_URL_RE = re.compile(r'(https?://(?:\S+\.)?notion\.(?:so|site)/[^\s]+)')
+
+# Resolved NotionFormatter webhook per channel ID, held as a future so that
+# concurrent first messages (and the startup warmup) share one fetch
+_WEBHOOK_CACHE = {}
+
+# Intake forum where Esmeralda validates posts; its thread starters must stay intact
+INTAKE_CHANNEL_ID = 1458858450355224709
+
+# Max concurrent Notion page lookups per message. Notion averages ~3 req/s
+# per integration; this caps lookups in flight, not the request rate. A
+# lookup rejected with 429 fails like any other and its link is left as is.
+_PAGE_LOOKUP_CONCURRENCY = 3
+
+
+async def _fetch_webhook(channel) -> discord.Webhook:
+    webhooks = await channel.webhooks()
+    webhook = {w.name: w for w in webhooks}.get("NotionFormatter")
+    
+    if not webhook:
+        webhook = await channel.create_webhook(name="NotionFormatter")
+    return webhook
+
+
+async def ensure_webhook(channel) -> discord.Webhook:
+    """
+    Returns the NotionFormatter webhook for a channel, fetching or creating
+    it on first use. Failed or cancelled lookups are not cached.
+    """
+    future = _WEBHOOK_CACHE.get(channel.id)
+    if future is None or future.cancelled():
+        future = asyncio.ensure_future(_fetch_webhook(channel))
+        _WEBHOOK_CACHE[channel.id] = future
+    try:
+        # Shielded: a cancelled caller must not cancel the fetch other callers share
+        return await asyncio.shield(future)
+    except BaseException:
+        failed = future.done() and (future.cancelled() or future.exception() is not None)
+        if failed and _WEBHOOK_CACHE.get(channel.id) is future:
+            del _WEBHOOK_CACHE[channel.id]
+        raise
+
+
+async def warm_webhook_cache(guilds):
+    """
+    Pre-resolves existing NotionFormatter webhooks so the first formatted
+    message in a channel does not wait on the webhook fetch.
+    Uses one guild-wide fetch per guild and never creates webhooks.
+    """
+    loop = asyncio.get_running_loop()
+    
+    async def warm(guild):
+        try:
+            webhooks = await guild.webhooks()
+        except discord.HTTPException as e:
+            logger.warning("Could not prefetch webhooks for guild %s: %s", guild.id, e)
+            return
+        for w in webhooks:
+            if w.name == "NotionFormatter" and w.channel_id not in _WEBHOOK_CACHE:
+                future = loop.create_future()
+                future.set_result(w)
+                _WEBHOOK_CACHE[w.channel_id] = future
+    
+    await asyncio.gather(*(warm(guild) for guild in guilds))
+
+
+async def _attachment_files(message: discord.Message) -> list:
+    if not message.attachments:
+        return []
+    # Download all attachments in parallel
+    return list(await asyncio.gather(*(a.to_file() for a in message.attachments)))
+
+
+async def process_notion_links(message: discord.Message, notion_service, *,
+                               intake_channel_id: Optional[int] = INTAKE_CHANNEL_ID):
     """
     Scans for Notion URLs and replaces them with Markdown links.
+    Starter messages of threads under `intake_channel_id` are left untouched;
+    pass None to disable that guard.
     Returns True if processed (enriched/replaced), False otherwise.
     """
     content = message.content
     
-    # CRITICAL: Skip starter messages in intake forum threads
-    # The intake channel ID where Esmeralda validates posts
-    INTAKE_CHANNEL_ID = 1458858450355224709
+    # Cheap filter before the regex: covers both notion.so and notion.site
+    pos = content.find("notion.")
+    if pos < 0:
+        return False
     
-    if isinstance(message.channel, discord.Thread):
+    # URLs contain no whitespace, so nothing before the whitespace preceding
+    # the first "notion." can be part of a match; only scan from there on
+    scan_start = max(content.rfind(ws, 0, pos) for ws in " \n\t") + 1
+    head, tail = content[:scan_start], content[scan_start:]
+    
+    channel = message.channel
+    is_thread = isinstance(channel, discord.Thread)
+    
+    # CRITICAL: Skip starter messages in intake forum threads
+    if is_thread and intake_channel_id is not None:
         # Check if this is the starter message (thread ID == message ID)
-        is_starter = message.id == message.channel.id
+        is_starter = message.id == channel.id
         # Check if thread belongs to intake forum
-        is_intake_thread = message.channel.parent_id == INTAKE_CHANNEL_ID
+        is_intake_thread = channel.parent_id == intake_channel_id
         
         if is_starter and is_intake_thread:
             # DO NOT process starter messages in intake threads
             # Esmeralda needs the original message to validate
             return False
     
-    # Check for Notion domains
-    if "notion.so" not in content and "notion.site" not in content:
-        return False
-
     # Find all Notion URLs
-    urls = re.findall(r'(https?://(?:\S+\.)?notion\.(?:so|site)/[^\s]+)', content)
+    urls = _NOTION_URL_RE.findall(tail)
     
     if not urls:
         return False
         
-    replaced_content = content
-    replacements_made = False
+    page_ids = notion_service.extract_page_ids(urls)
+    pairs = [(url, page_id) for url, page_id in zip(urls, page_ids) if page_id]
     
-    for url in urls:
-        page_id = notion_service.extract_page_id(url)
-        
-        if page_id:
-            info = notion_service.get_page_info(page_id)
-            if info:
-                title = info.get("title", "Notion Page")
-                replaced_content = replaced_content.replace(url, f"[{title}]({url})")
-                replacements_made = True
+    # Lookups are independent blocking calls; run them side by side
+    semaphore = asyncio.Semaphore(_PAGE_LOOKUP_CONCURRENCY)
+    
+    async def fetch_info(page_id):
+        async with semaphore:
+            return await asyncio.to_thread(notion_service.get_page_info, page_id)
+    
+    infos = await asyncio.gather(*(fetch_info(page_id) for _, page_id in pairs))
+    
+    title_map = {
+        url: info.get("title", "Notion Page")
+        for (url, _), info in zip(pairs, infos)
+        if info
+    }
+    replacements_made = bool(title_map)
+    
+    # One pass over the message; each match is rewritten at most once
+    def to_markdown(match):
+        url = match.group(1)
+        title = title_map.get(url)
+        return f"[{title}]({url})" if title is not None else match.group(0)
+    
+    replaced_content = head + _NOTION_URL_RE.sub(to_markdown, tail)
     
     if replacements_made:
         try:
             # 1. Prepare Webhook
-            webhook_channel = message.channel
-            if isinstance(message.channel, discord.Thread):
-                webhook_channel = message.channel.parent
+            webhook_channel = channel.parent if is_thread else channel
             
-            webhooks = await webhook_channel.webhooks()
-            webhook = None
-            for w in webhooks:
-                if w.name == "NotionFormatter":
-                    webhook = w
-                    break
-            
-            if not webhook:
-                webhook = await webhook_channel.create_webhook(name="NotionFormatter")
+            webhook = await ensure_webhook(webhook_channel)
             
             # 2. Send as User
+            author = message.author
+            display_name = author.display_name
+            avatar_url = author.display_avatar.url
             send_kwargs = {
                 "content": replaced_content,
-                "username": message.author.display_name,
-                "avatar_url": message.author.display_avatar.url,
-                "files": [await a.to_file() for a in message.attachments]
+                "username": display_name,
+                "avatar_url": avatar_url
             }
             
-            if isinstance(message.channel, discord.Thread):
-                send_kwargs["thread"] = message.channel
+            files = await _attachment_files(message)
+            if files:
+                send_kwargs["files"] = files
+            
+            if is_thread:
+                send_kwargs["thread"] = channel
             
-            await webhook.send(**send_kwargs)
+            try:
+                await webhook.send(**send_kwargs)
+            except discord.NotFound:
+                # Cached webhook was deleted; fetch or recreate it and retry once
+                _WEBHOOK_CACHE.pop(webhook_channel.id, None)
+                webhook = await ensure_webhook(webhook_channel)
+                if files:
+                    # Files are consumed by the failed send
+                    send_kwargs["files"] = await _attachment_files(message)
+                await webhook.send(**send_kwargs)
             
             # 3. Delete Original
             await message.delete()
             return True
             
         except Exception as e:
-            sys.stderr.write(f"Error auto-formatting: {e}\n")
+            logger.exception("Error auto-formatting: %s", e)
             return False
 
     return False
@@ -5,15 +5,19 @@ Test script to verify Notion MCP connection and database queries
 
 import sys
 import os
-from dotenv import load_dotenv
+import asyncio
+from collections import Counter
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+# Add src to path (once; pytest may already have imported from it)
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
 
 from services.mcp.notion_mcp import NotionMCPClient
+import env_once
 
 # Load environment
-load_dotenv()
+env_once.ensure()
 
 def test_mcp_connection():
     """Test MCP client in connection."""
@@ -35,10 +39,45 @@ def test_database_query():
     client = NotionMCPClient()
     database_id = "9b1d386dbae1401b8a58af5a792e8f1f"  # Growth & Strategy
     
-    # Test 1: Query all tasks
+    # One paginated pass over the database; backlog and active are subsets of it
     print(f"\n📋 Querying database {database_id}...")
-    result = client.query_database(database_id)
     
+    async def fetch_all():
+        try:
+            response = await client.aquery_database(database_id)
+            tasks = list(response.get("results", []))
+            while response.get("has_more"):
+                response = await client.aquery_database(
+                    database_id, start_cursor=response.get("next_cursor")
+                )
+                tasks.extend(response.get("results", []))
+            return tasks
+        finally:
+            await client.aclose()
+    
+    all_tasks = asyncio.run(fetch_all())
+    result = {"results": all_tasks}
+    
+    def status_of(task):
+        try:
+            return task["properties"]["Status"]["status"]["name"]
+        except (KeyError, TypeError):
+            return None
+    
+    def is_unassigned(task):
+        try:
+            return not task["properties"]["Asignado a"]["people"]
+        except KeyError:
+            return True
+    
+    # Backlog: Status=Pendiente OR Asignado a=empty
+    backlog_result = {"results": [
+        t for t in all_tasks if status_of(t) == "Pendiente" or is_unassigned(t)
+    ]}
+    # Active tasks (for capacity)
+    active_result = {"results": [t for t in all_tasks if status_of(t) != "Completada"]}
+    
+    # Test 1: All tasks
     total_tasks = len(result.get("results", []))
     print(f"   Total tasks found: {total_tasks}")
     
@@ -53,56 +92,31 @@ def test_database_query():
     else:
         print(f"   ⚠️  No tasks found in database")
     
-    # Test 2: Query backlog (Pendiente or unassigned)
-    print(f"\n📋 Querying backlog (Status=Pendiente OR Asignado a=empty)...")
-    backlog_filter = {
-        "or": [
-            {
-                "property": "Status",
-                "status": {
-                    "equals": "Pendiente"
-                }
-            },
-            {
-                "property": "Asignado a",
-                "people": {
-                    "is_empty": True
-                }
-            }
-        ]
-    }
-    
-    backlog_result = client.query_database(database_id, filter_params=backlog_filter)
+    # Test 2: Backlog (Status=Pendiente OR Asignado a=empty)
     backlog_count = len(backlog_result.get("results", []))
     print(f"   Backlog tasks: {backlog_count}")
     
-    # Test 3: Query active tasks (for capacity)
-    print(f"\n📋 Querying active tasks...")
-    active_filter = {
-        "property": "Status",
-        "status": {
-            "does_not_equal": "Completada"
-        }
-    }
-    
-    active_result = client.query_database(database_id, filter_params=active_filter)
+    # Test 3: Active tasks
     active_count = len(active_result.get("results", []))
     print(f"   Active tasks: {active_count}")
     
     # Show workload distribution
     if active_count > 0:
         print("\n👥 Workload distribution:")
-        workload = {}
-        for task in active_result["results"]:
-            assigned = task.get("properties", {}).get("Asignado a", {}).get("people", [])
-            if assigned:
-                for person in assigned:
-                    name = person.get("name", "Unknown")
-                    workload[name] = workload.get(name, 0) + 1
-            else:
-                workload["Unassigned"] = workload.get("Unassigned", 0) + 1
+        def assignee_names(task):
+            try:
+                people = task["properties"]["Asignado a"]["people"]
+            except KeyError:
+                people = None
+            if not people:
+                return ["Unassigned"]
+            return [person.get("name", "Unknown") for person in people]
+        
+        workload = Counter(
+            name for task in active_result["results"] for name in assignee_names(task)
+        )
         
-        for person, count in sorted(workload.items(), key=lambda x: x[1], reverse=True):
+        for person, count in workload.most_common():
             print(f"   - {person}: {count} tasks")
     
     return True
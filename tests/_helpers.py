@@ -0,0 +1,10 @@
+"""Shared test doubles."""
+
+
+class MockLogger:
+    """Logger stand-in that discards everything."""
+
+    def warning(self, msg, *args, **kwargs): pass
+    def info(self, msg, *args, **kwargs): pass
+    def error(self, msg, *args, **kwargs): pass
+    def debug(self, msg, *args, **kwargs): pass
@@ -0,0 +1,11 @@
+"""Put the project root and ``src`` on ``sys.path`` once for the whole suite."""
+
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SRC = os.path.join(ROOT, "src")
+
+for path in (ROOT, SRC):
+    if path not in sys.path:
+        sys.path.insert(0, path)
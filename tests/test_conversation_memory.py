@@ -4,28 +4,45 @@ Test Conversation Memory Skill
 Tests for the ConversationMemorySkill using unittest instead of pytest.
 """
 
+import asyncio
 import unittest
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import Mock
 import os
-import sys
+import re
 from pathlib import Path
 from datetime import datetime
 import tempfile
 import shutil
-
-# Add project root to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import threading
 
 from agents.design.skills.conversation_memory import ConversationMemorySkill
 from src.skills.base import SkillContext
 
 
-class MockLLMHandler:
-    """Mock LLM handler for testing."""
-    
-    def generate_completion(self, system_prompt, user_prompt, json_mode=False):
-        """Mock LLM completion."""
-        return """## Summary 1 (Messages 1-20)
+# Memory files are small and throwaway; keep them in RAM where available
+_TEMP_PARENT = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# One pass over a memory file picks up its header fields and summary headings
+_MEMORY_RE = re.compile(
+    r"^# Thread Memory: (?P<title>.+)$|^Thread ID: (?P<thread_id>\d+)$|^## (?P<summary>Summary \d+)",
+    re.MULTILINE,
+)
+
+
+def _parse_memory(text):
+    """Parse memory file content into its title, thread ID and summary headings."""
+    parsed = {"title": None, "thread_id": None, "summaries": []}
+    for match in _MEMORY_RE.finditer(text):
+        if match["summary"]:
+            parsed["summaries"].append(match["summary"])
+        elif match["thread_id"]:
+            parsed["thread_id"] = int(match["thread_id"])
+        else:
+            parsed["title"] = match["title"]
+    return parsed
+
+
+_CANNED_SUMMARY = """## Summary 1 (Messages 1-20)
 **Period**: 2026-02-12T10:00:00 - 2026-02-12T10:30:00
 **Generated**: 2026-02-12T10:30:00
 
@@ -46,56 +63,89 @@ class MockLLMHandler:
 """
 
 
+def _mock_llm():
+    """Build an LLMHandler stub whose completion returns the canned summary."""
+    llm = Mock(spec=["generate_completion"])
+    llm.generate_completion = Mock(return_value=_CANNED_SUMMARY)
+    return llm
+
+
 class TestConversationMemorySkill(unittest.IsolatedAsyncioTestCase):
     """Test suite for ConversationMemorySkill."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.memory_dir = os.path.join(self.temp_dir, "memory", "threads")
-        os.makedirs(self.memory_dir, exist_ok=True)
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by the whole class."""
+        cls.temp_root = tempfile.mkdtemp(prefix="conversation_memory_", dir=_TEMP_PARENT)
+        cls.addClassCleanup(shutil.rmtree, cls.temp_root, ignore_errors=True)
         
-        self.mock_llm = MockLLMHandler()
-        self.skill = ConversationMemorySkill(self.mock_llm, memory_base_path=self.memory_dir)
+        # Canned output, so one instance serves every test; compare
+        # call counts as deltas
+        cls.mock_llm = _mock_llm()
         
-        # Sample messages for testing
-        self.sample_messages = []
-        for i in range(20):
-            self.sample_messages.append({
+        # For tests that never write to the context; tests that run a
+        # summary (which records metadata) build their own
+        cls.shared_context = SkillContext()
+        
+        # Sample messages for testing; lists, as the skill's validation
+        # requires. setUp hands each test its own copy
+        cls.sample_messages = [
+            {
                 "author": f"@user{i % 3}",
                 "content": f"Test message {i + 1}",
                 "timestamp": f"2026-02-12T10:{i:02d}:00"
-            })
+            }
+            for i in range(20)
+        ]
+        
+        # Two consecutive batches for the incremental summary test
+        cls.messages_1 = [
+            {"author": "@user1", "content": f"Message {i}", "timestamp": f"2026-02-12T10:{i:02d}:00"}
+            for i in range(1, 21)
+        ]
+        cls.messages_2 = [
+            {"author": "@user2", "content": f"Message {i}", "timestamp": f"2026-02-12T11:{i-20:02d}:00"}
+            for i in range(21, 41)
+        ]
     
-    def tearDown(self):
-        """Clean up test fixtures."""
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+    def setUp(self):
+        """Set up test fixtures."""
+        # Each test gets its own memory directory under the shared root
+        self.memory_dir = os.path.join(self.temp_root, self._testMethodName, "memory", "threads")
+        os.makedirs(self.memory_dir, exist_ok=True)
+        
+        cls = type(self)
+        self.sample_messages = list(cls.sample_messages)
+        self.messages_1 = list(cls.messages_1)
+        self.messages_2 = list(cls.messages_2)
+        
+        self.skill = ConversationMemorySkill(self.mock_llm, memory_base_path=self.memory_dir)
     
     async def test_should_create_summary_threshold(self):
         """Test summary threshold detection."""
-        context = SkillContext()
-        
-        # Should not create at 19 messages
-        result = await self.skill.should_create_summary(context, 19, 0)
-        self.assertFalse(result)
+        context = self.shared_context
         
-        # Should create at 20 messages
-        result = await self.skill.should_create_summary(context, 20, 0)
-        self.assertTrue(result)
-        
-        # Should not create at 25 messages if last was at 20
-        result = await self.skill.should_create_summary(context, 25, 20)
-        self.assertFalse(result)
+        # (current count, last summary count, expected)
+        cases = (
+            (19, 0, False),   # Below the first threshold
+            (20, 0, True),    # First threshold reached
+            (25, 20, False),  # Last summary at 20, next due at 40
+            (40, 20, True),   # Second threshold reached
+        )
+        results = await asyncio.gather(*(
+            self.skill.should_create_summary(context, current, last)
+            for current, last, _ in cases
+        ))
         
-        # Should create at 40 messages if last was at 20
-        result = await self.skill.should_create_summary(context, 40, 20)
-        self.assertTrue(result)
+        for (current, last, expected), result in zip(cases, results):
+            with self.subTest(current=current, last=last):
+                self.assertEqual(result, expected)
     
     async def test_memory_file_creation(self):
         """Test that memory file is created with correct structure."""
         context = SkillContext()
         thread_id = 123456789
+        calls_before = self.mock_llm.generate_completion.call_count
         
         # Execute skill to create summary
         result = await self.skill.execute(
@@ -113,14 +163,37 @@ class TestConversationMemorySkill(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(memory_file.exists())
         
         # Verify file structure
-        content = memory_file.read_text()
-        self.assertIn("# Thread Memory: Test Thread", content)
-        self.assertIn(f"Thread ID: {thread_id}", content)
-        self.assertIn("Summary 1", content)
+        memory = _parse_memory(memory_file.read_text())
+        self.assertEqual(memory["title"], "Test Thread")
+        self.assertEqual(memory["thread_id"], thread_id)
+        self.assertEqual(memory["summaries"], ["Summary 1"])
+        self.assertEqual(self.mock_llm.generate_completion.call_count, calls_before + 1)
+    
+    async def test_llm_runs_in_worker_thread(self):
+        """Test that the blocking completion runs off the event loop thread."""
+        caller_threads = []
+        sync_llm = _mock_llm()
+        sync_llm.generate_completion.side_effect = lambda *args, **kwargs: (
+            caller_threads.append(threading.get_ident()) or _CANNED_SUMMARY
+        )
+        skill = ConversationMemorySkill(sync_llm, memory_base_path=self.memory_dir)
+        
+        result = await skill.execute(
+            SkillContext(),
+            thread_id=135792468,
+            messages=self.sample_messages,
+            thread_title="Sync Test",
+            current_count=20,
+            last_summary_count=0
+        )
+        
+        self.assertIsNotNone(result)
+        self.assertEqual(len(caller_threads), 1)
+        self.assertNotEqual(caller_threads[0], threading.get_ident())
     
     async def test_no_summary_below_threshold(self):
         """Test that no summary is created below threshold."""
-        context = SkillContext()
+        context = self.shared_context
         thread_id = 123456789
         
         # Only 10 messages - below threshold
@@ -128,6 +201,7 @@ class TestConversationMemorySkill(unittest.IsolatedAsyncioTestCase):
             {"author": "@user1", "content": f"Message {i}", "timestamp": f"2026-02-12T10:{i:02d}:00"}
             for i in range(10)
         ]
+        calls_before = self.mock_llm.generate_completion.call_count
         
         result = await self.skill.execute(
             context,
@@ -137,8 +211,9 @@ class TestConversationMemorySkill(unittest.IsolatedAsyncioTestCase):
             last_summary_count=0
         )
         
-        # No summary should be created
+        # No summary should be created, and the LLM is never asked
         self.assertIsNone(result)
+        self.assertEqual(self.mock_llm.generate_completion.call_count, calls_before)
     
     async def test_load_memory(self):
         """Test loading existing memory."""
@@ -159,47 +234,59 @@ class TestConversationMemorySkill(unittest.IsolatedAsyncioTestCase):
         loaded = await self.skill.load_memory(thread_id)
         
         self.assertIsNotNone(loaded)
-        self.assertIn("Test Thread", loaded)
-        self.assertIn(f"Thread ID: {thread_id}", loaded)
-        self.assertIn("Summary 1", loaded)
+        memory = _parse_memory(loaded)
+        self.assertEqual(memory["title"], "Test Thread")
+        self.assertEqual(memory["thread_id"], thread_id)
+        self.assertIn("Summary 1", memory["summaries"])
     
     async def test_load_nonexistent_memory(self):
         """Test loading memory for thread without memory file."""
         loaded = await self.skill.load_memory(999999999)
         self.assertIsNone(loaded)
     
+    async def test_cache_matches_file_and_tracks_outside_edits(self):
+        """Test that the write-through cache mirrors the file and yields to outside writes."""
+        context = SkillContext()
+        thread_id = 246813579
+        
+        result = await self.skill.execute(
+            context,
+            thread_id=thread_id,
+            messages=self.sample_messages,
+            thread_title="Cache Test",
+            current_count=20,
+            last_summary_count=0
+        )
+        memory_file = Path(result)
+        self.assertEqual(self.skill.peek(thread_id), memory_file.read_text())
+        
+        # Another process appends; the next load must see it
+        with open(memory_file, "a", encoding="utf-8") as f:
+            f.write("external note\n")
+        loaded = await self.skill.load_memory(thread_id)
+        self.assertTrue(loaded.endswith("external note\n"))
+        self.assertEqual(self.skill.peek(thread_id), loaded)
+    
     async def test_incremental_summaries(self):
         """Test that multiple summaries are appended correctly."""
         context = SkillContext()
         thread_id = 111222333
         
-        # Create first batch of messages (1-20)
-        messages_1 = [
-            {"author": "@user1", "content": f"Message {i}", "timestamp": f"2026-02-12T10:{i:02d}:00"}
-            for i in range(1, 21)
-        ]
-        
-        # Create first summary
+        # Create first summary from messages 1-20
         await self.skill.execute(
             context,
             thread_id=thread_id,
-            messages=messages_1,
+            messages=self.messages_1,
             thread_title="Incremental Test",
             current_count=20,
             last_summary_count=0
         )
         
-        # Create second batch of messages (21-40)
-        messages_2 = [
-            {"author": "@user2", "content": f"Message {i}", "timestamp": f"2026-02-12T11:{i-20:02d}:00"}
-            for i in range(21, 41)
-        ]
-        
-        # Create second summary
+        # Create second summary from messages 21-40
         await self.skill.execute(
             context,
             thread_id=thread_id,
-            messages=messages_2,
+            messages=self.messages_2,
             thread_title="Incremental Test",
             current_count=40,
             last_summary_count=20
@@ -209,11 +296,63 @@ class TestConversationMemorySkill(unittest.IsolatedAsyncioTestCase):
         loaded = await self.skill.load_memory(thread_id)
         self.assertIsNotNone(loaded)
         # At least 2 summary sections should exist
-        self.assertGreaterEqual(loaded.count("Summary"), 2)
+        self.assertGreaterEqual(len(_parse_memory(loaded)["summaries"]), 2)
+    
+    async def test_parallel_summaries_for_many_threads(self):
+        """Test that summaries for independent threads can run concurrently."""
+        context = SkillContext()
+        thread_ids = range(500000, 500008)
+        
+        results = await asyncio.gather(*(
+            self.skill.execute(
+                context,
+                thread_id=thread_id,
+                messages=self.sample_messages,
+                thread_title=f"Parallel {thread_id}",
+                current_count=20,
+                last_summary_count=0
+            )
+            for thread_id in thread_ids
+        ))
+        
+        for thread_id, result in zip(thread_ids, results):
+            with self.subTest(thread_id=thread_id):
+                self.assertIsNotNone(result)
+                memory = _parse_memory(self.skill.peek(thread_id))
+                self.assertEqual(memory["thread_id"], thread_id)
+                self.assertEqual(memory["summaries"], ["Summary 1"])
+    
+    async def test_header_written_once(self):
+        """Test that appending to an existing memory file keeps a single header."""
+        memory_file = Path(self.memory_dir) / "header_test.md"
+        header = self.skill._build_header(444555666, "Header Test")
+        
+        await self.skill._append_summary_to_file(memory_file, "## Summary 1", header)
+        await self.skill._append_summary_to_file(memory_file, "## Summary 2", header)
+        
+        content = memory_file.read_text()
+        self.assertEqual(content.count("# Thread Memory: Header Test"), 1)
+        self.assertTrue(content.startswith(header))
+        self.assertLess(content.index("Summary 1"), content.index("Summary 2"))
+    
+    async def test_concurrent_appends_share_one_header(self):
+        """Test that concurrent appends to one file neither duplicate the header nor interleave."""
+        memory_file = Path(self.memory_dir) / "concurrent_test.md"
+        header = self.skill._build_header(777888999, "Concurrent Test")
+        
+        await asyncio.gather(*(
+            self.skill._append_summary_to_file(memory_file, f"## Summary {n}", header)
+            for n in range(1, 9)
+        ))
+        
+        content = memory_file.read_text()
+        memory = _parse_memory(content)
+        self.assertEqual(content.count("# Thread Memory: Concurrent Test"), 1)
+        self.assertCountEqual(memory["summaries"], [f"Summary {n}" for n in range(1, 9)])
     
     async def test_validate_input(self):
         """Test input validation."""
-        context = SkillContext()
+        context = self.shared_context
         
         # Valid input
         valid = await self.skill.validate_input(
@@ -223,6 +362,10 @@ class TestConversationMemorySkill(unittest.IsolatedAsyncioTestCase):
         )
         self.assertTrue(valid)
         
+        # The fixtures the other tests pass to execute
+        for messages in (self.sample_messages, self.messages_1, self.messages_2):
+            self.assertTrue(await self.skill.validate_input(context, thread_id=123, messages=messages))
+        
         # Missing thread_id
         invalid1 = await self.skill.validate_input(context, messages=[])
         self.assertFalse(invalid1)
@@ -1,27 +1,17 @@
-import os
-import sys
 import unittest
 import datetime
-
-ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-SRC = os.path.join(ROOT, "src")
-if ROOT not in sys.path:
-    sys.path.insert(0, ROOT)
-if SRC not in sys.path:
-    sys.path.insert(0, SRC)
+from unittest.mock import AsyncMock, Mock
 
 from agents.design.agent import DesignAgent
-
-
-class _DummyBot:
-    pass
+from _helpers import MockLogger
 
 
 class DesignAgentHelperTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        agent_dir = os.path.join(ROOT, "agents", "design")
-        cls.agent = DesignAgent(_DummyBot(), "design", agent_dir)
+        # The helpers are pure; skip the constructor's config and skill loading
+        cls.agent = DesignAgent.__new__(DesignAgent)
+        cls.agent.logger = MockLogger()
 
     def test_normalize_deadline_same_year_future(self):
         reference = datetime.datetime(2026, 2, 2, tzinfo=datetime.timezone.utc)
@@ -38,16 +28,28 @@ class DesignAgentHelperTests(unittest.TestCase):
         result = self.agent._normalize_deadline("2026-02-02", reference)
         self.assertEqual(result, "2026-02-02")
 
-    def test_match_project_option_case_and_space(self):
-        options = ["Proyecto Alfa", "Beta Project"]
-        self.assertEqual(
-            self.agent._match_project_option("  proyecto  alfa ", options),
-            "Proyecto Alfa",
-        )
 
-    def test_match_project_option_unknown(self):
-        options = ["Proyecto Alfa", "Beta Project"]
-        self.assertIsNone(self.agent._match_project_option("Gamma", options))
+class DesignAgentLookupTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.agent = DesignAgent.__new__(DesignAgent)
+        self.agent.logger = MockLogger()
+        self.agent.notion_db_id = "db_id"
+        self.agent.bot = Mock()
+        self.agent.skills_executor = Mock()
+
+    async def test_find_existing_task_needs_a_guild(self):
+        self.assertIsNone(await self.agent._find_existing_task(None, 42))
+        self.agent.bot.notion.find_task_by_discord_thread.assert_not_called()
+
+    async def test_find_existing_task_queries_notion(self):
+        self.agent.bot.notion.find_task_by_discord_thread.return_value = "https://notion.so/task"
+        url = await self.agent._find_existing_task(Mock(id=7), 42)
+        self.assertEqual(url, "https://notion.so/task")
+        self.agent.bot.notion.find_task_by_discord_thread.assert_called_once_with("db_id", 7, 42)
+
+    async def test_starter_url_errors_are_swallowed(self):
+        self.agent.skills_executor.execute = AsyncMock(side_effect=RuntimeError("boom"))
+        self.assertIsNone(await self.agent._extract_starter_notion_url(Mock(), Mock(), 42))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from utils import domain_context
+
+
+class DomainContextTests(unittest.TestCase):
+    def test_every_project_has_its_sheet(self):
+        sheets = domain_context.PROJECT_SHEETS
+        self.assertEqual(list(sheets), list(domain_context._SHEET_SLUGS))
+        self.assertTrue(sheets["negocon"].startswith("Hoja de Producto: Negocon"))
+
+    def test_single_project_context_only_includes_that_sheet(self):
+        context = domain_context.get_context(["cooltech"])
+        self.assertIn(domain_context.TEAM_MEMBERS, context)
+        self.assertIn("Hoja de Producto: Cooltech", context)
+        self.assertNotIn("Hoja de Producto: Negocon", context)
+
+    def test_same_sheets_share_one_string(self):
+        self.assertIs(
+            domain_context.get_context(["negocon", "cooltech"]),
+            domain_context.get_context(("negocon", "cooltech")),
+        )
+        self.assertIs(
+            domain_context.get_full_context(),
+            domain_context.get_context(list(domain_context._SHEET_SLUGS)),
+        )
+
+    def test_full_context_includes_all_sheets(self):
+        full = domain_context.get_full_context()
+        self.assertIn(domain_context.PROJECTS_CONTEXT, full)
+        self.assertEqual(full, domain_context.get_context(domain_context._SHEET_SLUGS))
+
+    def test_horizontal_rule_inside_a_sheet_is_kept(self):
+        sheets = {slug: f"Hoja {slug}\n---\nDetalle" for slug in domain_context._SHEET_SLUGS}
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "project_sheets.md")
+            with open(path, "w", encoding="utf-8") as f:
+                f.writelines(f"<!-- sheet: {slug} -->\n{sheet}\n" for slug, sheet in sheets.items())
+
+            domain_context._project_sheets.cache_clear()
+            self.addCleanup(domain_context._project_sheets.cache_clear)
+            with patch.object(domain_context, "_SHEETS_PATH", path):
+                self.assertEqual(domain_context.PROJECT_SHEETS, sheets)
+
+
+if __name__ == "__main__":
+    unittest.main()
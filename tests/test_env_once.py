@@ -0,0 +1,20 @@
+import unittest
+from unittest.mock import patch
+
+import env_once
+
+
+class EnvOnceTests(unittest.TestCase):
+    def setUp(self):
+        env_once.ensure.cache_clear()
+        self.addCleanup(env_once.ensure.cache_clear)
+
+    def test_dotenv_is_parsed_once(self):
+        with patch.object(env_once, "load_dotenv", return_value=True) as load:
+            self.assertTrue(env_once.ensure())
+            self.assertTrue(env_once.ensure())
+        load.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+"""
+Tests for extracting Notion URLs from thread starter messages.
+"""
+
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+from agents.design.skills import extract_notion_url
+from agents.design.skills.extract_notion_url import ExtractNotionURLSkill
+from src.skills.base import SkillContext
+from utilities import notion as notion_links
+
+
+class TestExtractNotionURLSkill(unittest.IsolatedAsyncioTestCase):
+    """Test starter-message URL extraction."""
+
+    def setUp(self):
+        self.skill = ExtractNotionURLSkill()
+        self.context = SkillContext()
+
+    def _thread(self, content):
+        thread = Mock()
+        thread.fetch_message = AsyncMock(return_value=Mock(content=content))
+        return thread
+
+    async def test_first_url_is_returned(self):
+        thread = self._thread(
+            "Brief: https://www.notion.so/Spec-abc123 and https://team.notion.site/Other-def456"
+        )
+        url = await self.skill.execute(self.context, thread=thread, thread_id=1)
+        self.assertEqual(url, "https://www.notion.so/Spec-abc123")
+        self.assertEqual(self.context.get("notion_url"), url)
+
+    async def test_cached_starter_message_skips_fetch(self):
+        thread = self._thread("")
+        thread.starter_message = Mock(id=1, content="https://www.notion.so/Spec-abc123")
+
+        url = await self.skill.execute(self.context, thread=thread, thread_id=1)
+
+        self.assertEqual(url, "https://www.notion.so/Spec-abc123")
+        thread.fetch_message.assert_not_called()
+
+    def test_pattern_matches_link_formatter(self):
+        self.assertEqual(
+            extract_notion_url._NOTION_URL_RE.pattern, notion_links._NOTION_URL_RE.pattern
+        )
+
+    async def test_no_url(self):
+        url = await self.skill.execute(self.context, thread=self._thread("no link"), thread_id=1)
+        self.assertIsNone(url)
+
+    async def test_url_from_other_database_is_rejected(self):
+        thread = self._thread("https://www.notion.so/Spec-abc123")
+        url = await self.skill.execute(
+            self.context, thread=thread, thread_id=1, expected_database_id="ffff-0000"
+        )
+        self.assertIsNone(url)
+
+
+if __name__ == "__main__":
+    unittest.main()
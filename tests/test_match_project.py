@@ -0,0 +1,59 @@
+"""
+Tests for project name matching in the design agent skills.
+"""
+
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+from agents.design.skills.match_project import MatchProjectSkill, ProjectIndex
+from src.skills.base import SkillContext
+
+
+class TestProjectIndex(unittest.TestCase):
+    """Test the canonical reverse index."""
+
+    def setUp(self):
+        self.index = ProjectIndex(
+            ["Cobranza 360°", "Cask'r app", "Solkos Intelligence", "Proyecto Alfa"]
+        )
+
+    def test_match_ignores_case_spaces_and_punctuation(self):
+        self.assertEqual(self.index.match("cobranza 360"), "Cobranza 360°")
+        self.assertEqual(self.index.match("CASKR  APP"), "Cask'r app")
+        self.assertEqual(self.index.match("solkos-intelligence"), "Solkos Intelligence")
+        self.assertEqual(self.index.match("  proyecto  alfa "), "Proyecto Alfa")
+
+    def test_canonical_form_for_ascii_and_non_ascii(self):
+        self.assertEqual(MatchProjectSkill._canonical_project("Cask'r App!"), "caskrapp")
+        self.assertEqual(MatchProjectSkill._canonical_project("Cobranza 360°"), "cobranza360")
+        self.assertEqual(MatchProjectSkill._canonical_project("Diseño UI"), "diseñoui")
+
+    def test_unknown_project(self):
+        self.assertIsNone(self.index.match("Gamma"))
+
+
+class TestMatchProjectSkill(unittest.IsolatedAsyncioTestCase):
+    """Test the skill end to end with mocked Notion options."""
+
+    def setUp(self):
+        self.notion_mcp = Mock()
+        self.notion_mcp.get_select_options = AsyncMock(return_value=["Cooltech", "Negocon"])
+        self.skill = MatchProjectSkill(self.notion_mcp)
+        self.context = SkillContext()
+
+    async def test_matches_option(self):
+        result = await self.skill.execute(self.context, project_raw="cool tech", database_id="db")
+        self.assertEqual(result, "Cooltech")
+        self.assertEqual(self.context.get("matched_project"), "Cooltech")
+
+    async def test_unknown_project(self):
+        result = await self.skill.execute(self.context, project_raw="Gamma", database_id="db")
+        self.assertIsNone(result)
+
+    async def test_no_project_marker(self):
+        result = await self.skill.execute(self.context, project_raw="Sin proyecto", database_id="db")
+        self.assertIsNone(result)
+
+
+if __name__ == "__main__":
+    unittest.main()
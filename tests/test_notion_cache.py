@@ -0,0 +1,107 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from services.notion import NotionHandler
+from services.notion_cache import ThreadLinkCache
+
+
+_TASK_URL = "https://notion.so/Task-" + "a" * 32
+_THREAD_URL = "https://discord.com/channels/1/2/2"
+
+
+class ThreadLinkCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        self.path = os.path.join(self.temp_dir, "cache", "notion_cache.sqlite")
+
+    def _cache(self, **kwargs):
+        cache = ThreadLinkCache(self.path, **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_link_survives_reopen(self):
+        self._cache().set("db", "Discord Thread", 1, 2, "https://notion.so/Task-" + "a" * 32)
+        self.assertEqual(
+            self._cache().get("db", "Discord Thread", 1, 2), "https://notion.so/Task-" + "a" * 32
+        )
+        self.assertIsNone(self._cache().get("other_db", "Discord Thread", 1, 2))
+        self.assertIsNone(self._cache().get("db", "Other Thread", 1, 2))
+
+    def test_expired_link_is_ignored(self):
+        cache = self._cache(ttl=60)
+        cache.set("db", "Discord Thread", 1, 2, "https://notion.so/Task")
+        cache._conn.execute("UPDATE thread_links SET fetched_at = ?", (time.time() - 120,))
+        self.assertIsNone(cache.get("db", "Discord Thread", 1, 2))
+
+    def test_discard_page_drops_its_threads(self):
+        cache = self._cache()
+        cache.set("db", "Discord Thread", 1, 2, "https://notion.so/Task-" + "a" * 32)
+        cache.set("db", "Discord Thread", 1, 3, "https://notion.so/Other-" + "b" * 32)
+        cache.discard_page("a" * 32)
+        self.assertIsNone(cache.get("db", "Discord Thread", 1, 2))
+        self.assertIsNotNone(cache.get("db", "Discord Thread", 1, 3))
+
+    def _handler_with_stored_link(self):
+        first = NotionHandler("fake_token", thread_cache_path=self.path)
+        first.client = MagicMock()
+        first.client.databases.retrieve.return_value = {
+            "properties": {"Discord Thread": {"type": "url"}}
+        }
+        first.client.databases.query.return_value = {"results": [{"url": _TASK_URL}]}
+        self.assertEqual(first.find_task_by_discord_thread("db", 1, 2), _TASK_URL)
+        first._thread_cache.close()
+
+        second = NotionHandler("fake_token", thread_cache_path=self.path)
+        self.addCleanup(second._thread_cache.close)
+        second.client = MagicMock()
+        second.client.databases.retrieve.return_value = {
+            "properties": {"Discord Thread": {"type": "url"}}
+        }
+        second.client.databases.query.return_value = {"results": []}
+        return second
+
+    def test_handler_reuses_verified_link_found_by_previous_process(self):
+        handler = self._handler_with_stored_link()
+        handler.client.pages.retrieve.return_value = {
+            "archived": False,
+            "properties": {"Discord Thread": {"type": "url", "url": _THREAD_URL}},
+        }
+
+        self.assertEqual(handler.find_task_by_discord_thread("db", 1, 2), _TASK_URL)
+        handler.client.pages.retrieve.assert_called_once_with(page_id="a" * 32)
+        handler.client.databases.query.assert_not_called()
+
+    def test_stale_stored_link_is_dropped(self):
+        stale_pages = {
+            "archived": {
+                "archived": True,
+                "properties": {"Discord Thread": {"type": "url", "url": _THREAD_URL}},
+            },
+            "relinked": {
+                "archived": False,
+                "properties": {"Discord Thread": {"type": "url", "url": "https://discord.com/channels/1/9/9"}},
+            },
+        }
+        for reason, page in stale_pages.items():
+            with self.subTest(reason):
+                handler = self._handler_with_stored_link()
+                handler.client.pages.retrieve.return_value = page
+
+                self.assertIsNone(handler.find_task_by_discord_thread("db", 1, 2))
+                handler.client.databases.query.assert_called_once()
+                self.assertIsNone(handler._thread_cache.get("db", "Discord Thread", 1, 2))
+
+    def test_link_is_scoped_to_its_property(self):
+        handler = self._handler_with_stored_link()
+
+        self.assertIsNone(handler.find_task_by_discord_thread("db", 1, 2, property_name="Other Thread"))
+        handler.client.pages.retrieve.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,203 @@
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+import httpx
+from notion_client import APIResponseError
+
+from services import notion as notion_module
+from services.notion import NotionHandler
+
+
+class TestNotionHandler(unittest.TestCase):
+    def setUp(self):
+        self.handler = NotionHandler("fake_token")
+        self.handler.client = MagicMock()
+
+    def test_created_task_is_found_by_thread_without_network(self):
+        page_url = "https://notion.so/Task-0123456789abcdef0123456789abcdef"
+        self.handler.client.pages.create.return_value = {"url": page_url}
+        thread_url = "https://discord.com/channels/111/222/222"
+
+        self.handler.create_task("db_id", "Title", "Project", thread_url=thread_url)
+        self.handler.client.reset_mock()
+
+        found = self.handler.find_task_by_discord_thread("db_id", 111, 222)
+        self.assertEqual(found, page_url)
+        self.handler.client.databases.retrieve.assert_not_called()
+        self.handler.client.databases.query.assert_not_called()
+
+    def test_deleted_task_is_dropped_from_thread_index(self):
+        page_url = "https://notion.so/Task-0123456789abcdef0123456789abcdef"
+        self.handler.client.pages.create.return_value = {"url": page_url}
+        self.handler.create_task(
+            "db_id", "Title", "Project", thread_url="https://discord.com/channels/111/222/222"
+        )
+
+        self.handler.delete_page("0123456789abcdef0123456789abcdef")
+        self.assertEqual(self.handler._thread_index, {})
+
+    def test_thread_link_update_skipped_when_value_unchanged(self):
+        self.handler.client.databases.retrieve.return_value = {
+            "properties": {"Discord Thread": {"type": "url"}}
+        }
+        thread_url = "https://discord.com/channels/111/222/222"
+
+        self.assertTrue(self.handler.update_task_with_thread_link("db_id", "page-id", thread_url))
+        self.assertTrue(self.handler.update_task_with_thread_link("db_id", "page-id", thread_url))
+        self.assertEqual(self.handler.client.pages.update.call_count, 1)
+
+        self.handler.delete_page("page-id")
+        self.handler.client.pages.update.reset_mock()
+        self.assertTrue(self.handler.update_task_with_thread_link("db_id", "page-id", thread_url))
+        self.handler.client.pages.update.assert_called_once()
+
+    def test_title_property_is_cached_and_used_for_new_tasks(self):
+        self.handler.client.databases.retrieve.return_value = {
+            "properties": {"Tarea": {"type": "title"}, "Proyecto": {"type": "multi_select"}}
+        }
+        self.handler.client.pages.create.return_value = {"url": "https://notion.so/x"}
+
+        self.handler.create_task("db_id", "One", "Project")
+        self.handler._cache.pop("db_props:db_id")
+        self.handler.create_task("db_id", "Two", "Project")
+
+        self.assertEqual(self.handler.client.databases.retrieve.call_count, 1)
+        properties = self.handler.client.pages.create.call_args.kwargs["properties"]
+        self.assertIn("Tarea", properties)
+        self.assertNotIn("Name", properties)
+
+    def test_search_in_database_filters_on_title_server_side(self):
+        self.handler.client.databases.retrieve.return_value = {
+            "properties": {"Nombre": {"type": "title"}}
+        }
+        self.handler.client.databases.query.return_value = {"results": [{
+            "id": "p1",
+            "url": "https://notion.so/p1",
+            "properties": {"Nombre": {"type": "title", "title": [{"plain_text": "Logo Cooltech"}]}},
+        }]}
+
+        results = self.handler.search_pages("Logo", limit=3, database_id="db_id")
+
+        self.assertEqual([r["title"] for r in results], ["Logo Cooltech"])
+        self.handler.client.databases.query.assert_called_once_with(
+            database_id="db_id",
+            filter={"property": "Nombre", "title": {"contains": "Logo"}},
+            page_size=3,
+        )
+        self.handler.client.search.assert_not_called()
+
+    def test_content_is_capped_at_one_request_of_blocks(self):
+        self.handler.client.databases.retrieve.return_value = {"properties": {}}
+        self.handler.client.pages.create.return_value = {"url": "https://notion.so/test"}
+        content = "x" * (notion_module._MAX_CONTENT_CHARS + 5)
+
+        with self.assertLogs(notion_module.logger, level="WARNING"):
+            self.handler.create_task("db_id", "Title", "Project", content=content)
+
+        blocks = self.handler.client.pages.create.call_args.kwargs["children"]
+        self.assertEqual(len(blocks), notion_module._MAX_CHILDREN)
+        self.assertEqual(len(blocks[-1]["paragraph"]["rich_text"][0]["text"]["content"]), notion_module._BLOCK_CHARS)
+
+    def test_thread_batch_lookup_uses_one_query(self):
+        self.handler.client.databases.retrieve.return_value = {
+            "properties": {"Discord Thread": {"type": "url"}}
+        }
+        self.handler.client.databases.query.return_value = {"results": [{
+            "url": "https://notion.so/task-2",
+            "properties": {"Discord Thread": {
+                "type": "url", "url": "https://discord.com/channels/1/2/2"
+            }},
+        }]}
+        self.handler._thread_index[("db_id", "Discord Thread", 1, 3)] = (
+            time.time(), "https://notion.so/task-3"
+        )
+
+        found = self.handler.find_tasks_by_discord_threads("db_id", 1, [2, 3, 4])
+
+        self.assertEqual(found, {
+            2: "https://notion.so/task-2",
+            3: "https://notion.so/task-3",
+            4: None,
+        })
+        self.handler.client.databases.query.assert_called_once()
+        clauses = self.handler.client.databases.query.call_args.kwargs["filter"]["or"]
+        self.assertEqual(
+            [c["url"]["equals"] for c in clauses],
+            ["https://discord.com/channels/1/2/2", "https://discord.com/channels/1/4/4"],
+        )
+
+    def test_thread_batch_lookup_rechecks_old_links(self):
+        self.handler.client.databases.retrieve.return_value = {
+            "properties": {"Discord Thread": {"type": "url"}}
+        }
+        self.handler.client.databases.query.return_value = {"results": []}
+        link_key = ("db_id", "Discord Thread", 1, 5)
+        self.handler._thread_index[link_key] = (0, "https://notion.so/archived-task")
+
+        found = self.handler.find_tasks_by_discord_threads("db_id", 1, [5])
+
+        self.assertEqual(found, {5: None})
+        self.handler.client.databases.query.assert_called_once()
+        self.assertNotIn(link_key, self.handler._thread_index)
+
+    def test_extract_page_ids_matches_single_extraction(self):
+        urls = [
+            "https://notion.so/Task-0123456789abcdef0123456789abcdef",
+            "https://notion.so/01234567-89ab-cdef-0123-456789abcdef?v=1",
+            "https://notion.so/no-id-here",
+        ]
+        self.assertEqual(
+            NotionHandler.extract_page_ids(urls),
+            [NotionHandler.extract_page_id(url) for url in urls],
+        )
+        self.assertIsNone(NotionHandler.extract_page_ids(urls)[2])
+
+    def test_page_info_is_cached(self):
+        self.handler.client.pages.retrieve.return_value = {
+            "id": "abc",
+            "url": "https://notion.so/abc",
+            "properties": {"Name": {"type": "title", "title": [{"plain_text": "Spec"}]}},
+        }
+
+        first = self.handler.get_page_info("abc")
+        second = self.handler.get_page_info("abc")
+
+        self.assertEqual(first["title"], "Spec")
+        self.assertEqual(first, second)
+        self.handler.client.pages.retrieve.assert_called_once()
+
+
+class TestGetNotion(unittest.TestCase):
+    def test_same_token_shares_one_handler(self):
+        handler = notion_module.get_notion("fake_token")
+        self.assertIs(notion_module.get_notion("fake_token"), handler)
+        self.assertIsNot(notion_module.get_notion("other_token"), handler)
+        self.assertIs(handler.client, NotionHandler("fake_token").client)
+
+    def test_default_token_shares_the_explicit_handler(self):
+        with patch.dict("os.environ", {"NOTION_TOKEN": "env_token"}):
+            self.assertIs(notion_module.get_notion(), notion_module.get_notion("env_token"))
+
+
+@unittest.skipUnless(notion_module.orjson, "orjson not installed")
+class TestOrjsonClient(unittest.TestCase):
+    def test_success_body_is_decoded(self):
+        client = notion_module._OrjsonClient(auth="fake_token")
+        response = httpx.Response(200, content=b'{"results": [{"id": "abc"}]}')
+        self.assertEqual(client._parse_response(response), {"results": [{"id": "abc"}]})
+
+    def test_error_keeps_sdk_error_handling(self):
+        client = notion_module._OrjsonClient(auth="fake_token")
+        request = httpx.Request("GET", "https://api.notion.com/v1/pages/x")
+        response = httpx.Response(
+            404,
+            request=request,
+            json={"object": "error", "code": "object_not_found", "message": "missing"},
+        )
+        with self.assertRaises(APIResponseError):
+            client._parse_response(response)
+
+
+if __name__ == '__main__':
+    unittest.main()
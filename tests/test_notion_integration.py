@@ -1,19 +1,12 @@
+import asyncio
 import os
-import sys
 import unittest
 import datetime
 
-ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-SRC = os.path.join(ROOT, "src")
-if ROOT not in sys.path:
-    sys.path.insert(0, ROOT)
-if SRC not in sys.path:
-    sys.path.insert(0, SRC)
-
 from services.notion import NotionHandler
 
 
-class NotionIntegrationTests(unittest.TestCase):
+class NotionIntegrationTests(unittest.IsolatedAsyncioTestCase):
     def setUp(self):
         self.token = os.getenv("NOTION_TOKEN")
         self.db_id = os.getenv("NOTION_DB_ID")
@@ -23,13 +16,18 @@ class NotionIntegrationTests(unittest.TestCase):
         if not self.handler.is_enabled():
             self.skipTest("Notion client not enabled.")
 
-    def test_create_and_archive_task(self):
-        options = self.handler.get_multi_select_options(self.db_id, "Proyecto")
-        project = options[0] if options else None
+    async def test_create_and_archive_task(self):
+        # The handler is synchronous; fetch the options off the loop while the task is prepared
+        options_task = asyncio.create_task(
+            asyncio.to_thread(self.handler.get_multi_select_options, self.db_id, "Proyecto")
+        )
         title = "Integration Test Task"
         deadline = datetime.date.today().isoformat()
+        options = await options_task
+        project = options[0] if options else None
 
-        url = self.handler.create_task(
+        url = await asyncio.to_thread(
+            self.handler.create_task,
             self.db_id,
             title,
             project or "Sin Proyecto",
@@ -40,7 +38,7 @@ class NotionIntegrationTests(unittest.TestCase):
 
         page_id = self.handler.extract_page_id(url)
         if page_id:
-            deleted = self.handler.delete_page(page_id)
+            deleted = await asyncio.to_thread(self.handler.delete_page, page_id)
             self.assertTrue(deleted)
 
 
@@ -0,0 +1,202 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import discord
+
+from utilities import notion as notion_links
+from utilities.notion import process_notion_links
+
+
+class _FakeNotion:
+    """Resolves page IDs to titles without touching the network."""
+
+    def __init__(self, titles):
+        self.titles = titles
+        self.lookups = []
+
+    @staticmethod
+    def extract_page_id(url):
+        return url.rsplit("-", 1)[-1]
+
+    @classmethod
+    def extract_page_ids(cls, urls):
+        return [cls.extract_page_id(url) for url in urls]
+
+    def get_page_info(self, page_id):
+        self.lookups.append(page_id)
+        title = self.titles.get(page_id)
+        return {"title": title} if title else None
+
+
+def _make_message(content):
+    webhook = MagicMock()
+    webhook.send = AsyncMock()
+
+    channel = MagicMock()
+    channel.id = 42
+    channel.webhooks = AsyncMock(return_value=[])
+    channel.create_webhook = AsyncMock(return_value=webhook)
+
+    message = MagicMock()
+    message.content = content
+    message.channel = channel
+    message.attachments = []
+    message.delete = AsyncMock()
+    return message, webhook
+
+
+class ProcessNotionLinksTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        notion_links._WEBHOOK_CACHE.clear()
+
+    async def test_message_without_links_is_left_alone(self):
+        message, webhook = _make_message("no links here")
+        notion = _FakeNotion({})
+
+        self.assertFalse(await process_notion_links(message, notion))
+        self.assertEqual(notion.lookups, [])
+        webhook.send.assert_not_called()
+
+    async def test_links_are_replaced_with_titles(self):
+        first = "https://www.notion.so/Spec-aaa"
+        second = "https://www.notion.so/Plan-bbb"
+        message, webhook = _make_message(f"see {first} and {second}")
+        notion = _FakeNotion({"aaa": "Spec", "bbb": "Plan"})
+
+        self.assertTrue(await process_notion_links(message, notion))
+        sent = webhook.send.call_args.kwargs["content"]
+        self.assertEqual(sent, f"see [Spec]({first}) and [Plan]({second})")
+        self.assertCountEqual(notion.lookups, ["aaa", "bbb"])
+        message.delete.assert_awaited_once()
+
+    async def test_text_before_first_link_is_preserved(self):
+        url = "https://www.notion.so/Spec-aaa"
+        message, webhook = _make_message(f"intro line\nsee:\t{url} done")
+        notion = _FakeNotion({"aaa": "Spec"})
+
+        self.assertTrue(await process_notion_links(message, notion))
+        sent = webhook.send.call_args.kwargs["content"]
+        self.assertEqual(sent, f"intro line\nsee:\t[Spec]({url}) done")
+
+    async def test_repeated_link_is_wrapped_once_per_occurrence(self):
+        url = "https://www.notion.so/Spec-aaa"
+        message, webhook = _make_message(f"{url} {url}")
+        notion = _FakeNotion({"aaa": "Spec"})
+
+        self.assertTrue(await process_notion_links(message, notion))
+        sent = webhook.send.call_args.kwargs["content"]
+        self.assertEqual(sent, f"[Spec]({url}) [Spec]({url})")
+
+    async def test_unresolved_links_do_not_trigger_repost(self):
+        message, webhook = _make_message("see https://www.notion.so/Gone-zzz")
+        notion = _FakeNotion({})
+
+        self.assertFalse(await process_notion_links(message, notion))
+        webhook.send.assert_not_called()
+        message.delete.assert_not_called()
+
+    async def test_webhook_is_fetched_once_per_channel(self):
+        url = "https://www.notion.so/Spec-aaa"
+        notion = _FakeNotion({"aaa": "Spec"})
+        first, webhook = _make_message(f"see {url}")
+        second, _ = _make_message(f"again {url}")
+        second.channel = first.channel
+
+        await process_notion_links(first, notion)
+        await process_notion_links(second, notion)
+
+        first.channel.webhooks.assert_awaited_once()
+        self.assertEqual(webhook.send.await_count, 2)
+
+    async def test_attachments_are_forwarded(self):
+        url = "https://www.notion.so/Spec-aaa"
+        message, webhook = _make_message(f"see {url}")
+        attachment = MagicMock()
+        attachment.to_file = AsyncMock(return_value="file")
+        message.attachments = [attachment, attachment]
+
+        await process_notion_links(message, _FakeNotion({"aaa": "Spec"}))
+        self.assertEqual(webhook.send.call_args.kwargs["files"], ["file", "file"])
+
+    async def test_no_files_kwarg_without_attachments(self):
+        message, webhook = _make_message("see https://www.notion.so/Spec-aaa")
+
+        await process_notion_links(message, _FakeNotion({"aaa": "Spec"}))
+        self.assertNotIn("files", webhook.send.call_args.kwargs)
+
+    async def test_warmed_webhook_skips_channel_fetch(self):
+        message, _ = _make_message("see https://www.notion.so/Spec-aaa")
+        warmed = MagicMock()
+        warmed.name = "NotionFormatter"
+        warmed.channel_id = message.channel.id
+        warmed.send = AsyncMock()
+        guild = MagicMock()
+        guild.webhooks = AsyncMock(return_value=[warmed])
+
+        await notion_links.warm_webhook_cache([guild])
+        self.assertTrue(await process_notion_links(message, _FakeNotion({"aaa": "Spec"})))
+
+        message.channel.webhooks.assert_not_called()
+        warmed.send.assert_awaited_once()
+
+    async def test_cancelled_caller_does_not_poison_webhook_cache(self):
+        channel = MagicMock(id=42)
+        webhook = MagicMock()
+        release = asyncio.Event()
+
+        async def fetch(_channel):
+            await release.wait()
+            return webhook
+
+        with patch.object(notion_links, "_fetch_webhook", side_effect=fetch) as fetch_mock:
+            first = asyncio.create_task(notion_links.ensure_webhook(channel))
+            await asyncio.sleep(0)
+            first.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await first
+
+            second = asyncio.create_task(notion_links.ensure_webhook(channel))
+            await asyncio.sleep(0)
+            release.set()
+            self.assertIs(await second, webhook)
+            fetch_mock.assert_called_once()
+
+    async def test_cancelled_fetch_is_refetched(self):
+        channel = MagicMock(id=43)
+        webhook = MagicMock()
+
+        with patch.object(notion_links, "_fetch_webhook", AsyncMock(return_value=webhook)) as fetch_mock:
+            cancelled = asyncio.get_running_loop().create_future()
+            cancelled.cancel()
+            notion_links._WEBHOOK_CACHE[channel.id] = cancelled
+
+            self.assertIs(await notion_links.ensure_webhook(channel), webhook)
+            fetch_mock.assert_awaited_once_with(channel)
+
+    def _intake_starter(self, content):
+        message, webhook = _make_message(content)
+        thread = MagicMock(spec=discord.Thread)
+        thread.id = message.id = 7
+        thread.parent_id = notion_links.INTAKE_CHANNEL_ID
+        thread.parent = message.channel
+        message.channel = thread
+        return message, webhook
+
+    async def test_intake_thread_starter_is_skipped(self):
+        message, webhook = self._intake_starter("see https://www.notion.so/Spec-aaa")
+
+        self.assertFalse(await process_notion_links(message, _FakeNotion({"aaa": "Spec"})))
+        webhook.send.assert_not_called()
+
+    async def test_intake_guard_can_be_disabled(self):
+        message, webhook = self._intake_starter("see https://www.notion.so/Spec-aaa")
+
+        self.assertTrue(await process_notion_links(
+            message, _FakeNotion({"aaa": "Spec"}), intake_channel_id=None
+        ))
+        self.assertIs(webhook.send.call_args.kwargs["thread"], message.channel)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from services.mcp.notion_mcp import NotionMCPClient
+from services.notion import NotionHandler
+
+
+class NotionMCPClientTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.client = NotionMCPClient("fake_token")
+        self.client.client = MagicMock()
+        self.client.client.databases.retrieve.return_value = {"properties": {}}
+
+    async def test_create_pages_returns_urls_in_order(self):
+        self.client.client.pages.create.side_effect = lambda **kwargs: {
+            "url": kwargs["properties"]["Name"]
+        }
+        pages = [{"properties": {"Name": f"task-{i}"}} for i in range(5)]
+
+        urls = await self.client.create_pages("db_id", pages)
+
+        self.assertEqual(urls, [f"task-{i}" for i in range(5)])
+        self.assertEqual(self.client.client.pages.create.call_count, 5)
+
+    async def test_failed_create_yields_none(self):
+        self.client.client.pages.create.side_effect = [{"url": "ok"}, RuntimeError("rate limited")]
+        pages = [{"properties": {}}, {"properties": {}}]
+
+        urls = await self.client.create_pages("db_id", pages, max_concurrency=1)
+
+        self.assertEqual(urls, ["ok", None])
+
+    async def test_schema_records_title_property(self):
+        self.client.client.databases.retrieve.return_value = {
+            "title": [{"plain_text": "Tasks"}],
+            "properties": {
+                "Status": {"type": "status", "id": "a"},
+                "Nombre": {"type": "title", "id": "title"},
+            },
+        }
+
+        schema = await self.client.get_database_schema("db_id")
+
+        self.assertEqual(schema["title_property"], "Nombre")
+        self.assertEqual(schema["properties"]["Nombre"]["type"], "title")
+
+    async def test_async_queries_share_one_http_client(self):
+        response = MagicMock(content=b'{"results": [{"id": "p1"}]}')
+        response.json.return_value = {"results": [{"id": "p1"}]}
+        http_client = MagicMock(is_closed=False)
+        http_client.post = AsyncMock(return_value=response)
+        http_client.aclose = AsyncMock()
+
+        with patch("httpx.AsyncClient", return_value=http_client) as client_cls:
+            first = await self.client.aquery_database("db_id")
+            second = await self.client.aquery_database("db_id", start_cursor="next")
+            await self.client.aclose()
+
+        self.assertEqual(first, {"results": [{"id": "p1"}]})
+        self.assertEqual(second, first)
+        client_cls.assert_called_once()
+        self.assertEqual(http_client.post.await_count, 2)
+        http_client.aclose.assert_awaited_once()
+
+    def test_reuses_injected_sdk_client(self):
+        handler = NotionHandler("shared_token")
+        self.assertIs(NotionMCPClient(client=handler.client).client, handler.client)
+
+
+if __name__ == "__main__":
+    unittest.main()
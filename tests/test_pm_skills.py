@@ -4,31 +4,47 @@ Test suite for PM Agent Skills
 Tests all PM agent skills with realistic scenarios.
 """
 
-import os
-import sys
 import unittest
 from unittest.mock import Mock, AsyncMock, patch
 import json
-
-ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-if ROOT not in sys.path:
-    sys.path.insert(0, ROOT)
+from datetime import date, timedelta
 
 from agents.pm.skills.parse_daily_sync import ParseDailySyncSkill
 from agents.pm.skills.track_capacity import TrackCapacitySkill
-from agents.pm.skills.manage_backlog import ManageBacklogSkill
+from agents.pm.skills.manage_backlog import ManageBacklogSkill, _parse_deadline
 from agents.pm.skills.document_decision import DocumentDecisionSkill
 from agents.pm.skills.translate_feedback import TranslateFeedbackSkill
 from src.skills.base import SkillContext
 
 
+# Skills only talk to the bot through these mocks, so one instance is reset
+# between tests instead of rebuilding the tree in every setUp
+_SHARED_BOT = Mock(notion_mcp=Mock(), llm=Mock())
+
+# None of these skills write to the context, so they can share one
+_SHARED_CONTEXT = SkillContext()
+
+# Canned LLM replies for the feedback clarity check, serialized once
+_CLEAR_RESP = json.dumps({"is_clear": True, "questions": []})
+_VAGUE_RESP = json.dumps({
+    "is_clear": False,
+    "questions": ["¿Qué botón específicamente?", "¿Qué significa 'se ve raro'?"]
+})
+
+
+def _shared_bot():
+    """Return the shared bot mock with its calls and configuration cleared."""
+    _SHARED_BOT.reset_mock(return_value=True, side_effect=True)
+    return _SHARED_BOT
+
+
 class TestParseDailySyncSkill(unittest.IsolatedAsyncioTestCase):
     """Test daily sync parsing."""
     
     def setUp(self):
-        self.bot = Mock()
+        self.bot = _shared_bot()
         self.skill = ParseDailySyncSkill(self.bot)
-        self.context = SkillContext()
+        self.context = _SHARED_CONTEXT
     
     async def test_parse_valid_daily_sync(self):
         """Test parsing a valid daily sync message."""
@@ -98,10 +114,9 @@ class TestTrackCapacitySkill(unittest.IsolatedAsyncioTestCase):
     """Test capacity tracking."""
     
     def setUp(self):
-        self.bot = Mock()
-        self.bot.notion_mcp = Mock()
+        self.bot = _shared_bot()
         self.skill = TrackCapacitySkill(self.bot)
-        self.context = SkillContext()
+        self.context = _SHARED_CONTEXT
     
     async def test_calculate_workload(self):
         """Test workload calculation."""
@@ -174,17 +189,18 @@ class TestManageBacklogSkill(unittest.IsolatedAsyncioTestCase):
     """Test backlog management."""
     
     def setUp(self):
-        self.bot = Mock()
-        self.bot.notion_mcp = Mock()
+        self.bot = _shared_bot()
         self.skill = ManageBacklogSkill(self.bot)
-        self.context = SkillContext()
+        self.context = _SHARED_CONTEXT
     
     def test_priority_scoring(self):
         """Test priority score calculation."""
+        today = date.today()
+        
         # High priority: Vexia project with deadline in 3 days
         score1 = self.skill._calculate_priority_score(
             "Vexia",
-            "2026-02-15",  # Assuming test runs around 2026-02-12
+            (today + timedelta(days=3)).isoformat(),
             ["Vexia"]
         )
         
@@ -198,23 +214,33 @@ class TestManageBacklogSkill(unittest.IsolatedAsyncioTestCase):
         # Overdue task
         score3 = self.skill._calculate_priority_score(
             "Other",
-            "2026-01-01",
+            (today - timedelta(days=30)).isoformat(),
             ["Vexia"]
         )
         
         self.assertGreater(score1, score2)
         self.assertGreater(score3, score1)  # Overdue is highest priority
+    
+    def test_shared_deadline_is_parsed_once(self):
+        """Test that tasks sharing a deadline reuse the parsed date."""
+        _parse_deadline.cache_clear()
+        deadline = (date.today() + timedelta(days=10)).isoformat()
+        
+        first = self.skill._calculate_priority_score("Internal", deadline, ["Vexia"])
+        second = self.skill._calculate_priority_score("Internal", deadline, ["Vexia"])
+        
+        self.assertEqual(first, second)
+        self.assertEqual(_parse_deadline.cache_info().misses, 1)
+        self.assertEqual(_parse_deadline.cache_info().hits, 1)
 
 
 class TestDocumentDecisionSkill(unittest.IsolatedAsyncioTestCase):
     """Test decision documentation."""
     
     def setUp(self):
-        self.bot = Mock()
-        self.bot.llm = Mock()
-        self.bot.notion_mcp = Mock()
+        self.bot = _shared_bot()
         self.skill = DocumentDecisionSkill(self.bot)
-        self.context = SkillContext()
+        self.context = _SHARED_CONTEXT
     
     def test_contains_decision(self):
         """Test decision keyword detection."""
@@ -232,18 +258,13 @@ class TestTranslateFeedbackSkill(unittest.IsolatedAsyncioTestCase):
     """Test feedback translation."""
     
     def setUp(self):
-        self.bot = Mock()
-        self.bot.llm = Mock()
-        self.bot.notion_mcp = Mock()
+        self.bot = _shared_bot()
         self.skill = TranslateFeedbackSkill(self.bot)
-        self.context = SkillContext()
+        self.context = _SHARED_CONTEXT
     
     async def test_clarity_check_clear_feedback(self):
         """Test clarity check with clear feedback."""
-        self.bot.llm.generate_completion = Mock(return_value=json.dumps({
-            "is_clear": True,
-            "questions": []
-        }))
+        self.bot.llm.generate_completion.return_value = _CLEAR_RESP
         
         result = await self.skill._check_feedback_clarity(
             "El botón de login debe ser azul #0066CC y tener 16px de padding"
@@ -254,10 +275,7 @@ class TestTranslateFeedbackSkill(unittest.IsolatedAsyncioTestCase):
     
     async def test_clarity_check_vague_feedback(self):
         """Test clarity check with vague feedback."""
-        self.bot.llm.generate_completion = Mock(return_value=json.dumps({
-            "is_clear": False,
-            "questions": ["¿Qué botón específicamente?", "¿Qué significa 'se ve raro'?"]
-        }))
+        self.bot.llm.generate_completion.return_value = _VAGUE_RESP
         
         result = await self.skill._check_feedback_clarity(
             "El botón se ve raro, arréglalo"
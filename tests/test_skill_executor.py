@@ -0,0 +1,57 @@
+import dataclasses
+import unittest
+
+from src.skills.base import BaseSkill, SkillContext, SkillExecutor, SkillRegistry
+
+
+class _EchoSkill(BaseSkill):
+    def __init__(self, name="echo"):
+        super().__init__(name, "Returns its input")
+
+    async def execute(self, context, **kwargs):
+        return kwargs.get("value")
+
+
+class _RejectingSkill(_EchoSkill):
+    async def validate_input(self, context, **kwargs):
+        return False
+
+
+class SkillExecutorTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.registry = SkillRegistry()
+        self.executor = SkillExecutor(self.registry)
+
+    async def test_default_validation_is_not_awaited(self):
+        self.registry.register(_EchoSkill())
+        result = await self.executor.execute("echo", SkillContext(), value=7)
+        self.assertEqual(result, 7)
+
+    async def test_async_validation_override_is_awaited(self):
+        self.registry.register(_RejectingSkill("reject"))
+        with self.assertRaises(ValueError):
+            await self.executor.execute("reject", SkillContext(), value=7)
+
+    async def test_unregistered_skill_is_not_dispatched(self):
+        self.registry.register(_EchoSkill())
+        self.registry.unregister("echo")
+        with self.assertRaises(ValueError):
+            await self.executor.execute("echo", SkillContext())
+
+
+class SkillContextTests(unittest.TestCase):
+    def test_accessors_follow_reassigned_data(self):
+        context = SkillContext(data={"old": 1})
+        context.data = {}
+        context.set("key", "value")
+        context.update({"other": 2})
+        self.assertEqual(context.data, {"key": "value", "other": 2})
+        self.assertIsNone(context.get("old"))
+
+    def test_fields_are_only_state(self):
+        names = [f.name for f in dataclasses.fields(SkillContext)]
+        self.assertEqual(names, ["data", "agent", "message"])
+
+
+if __name__ == "__main__":
+    unittest.main()